@@ -19,25 +19,52 @@ Built for clarity. Designed for humans. Crafted with love.
 """
 
 from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from functools import wraps
-from typing import Callable
+from typing import Callable, Optional
 import logging
-from datetime import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import numpy as np
+import orjson
 from colorama import Fore, Back, Style, init
 
 from config import config
-from services import UnifiedForecastService
-from cache import tempo_cache, forecast_cache
+from queued_logging import start_queued_logging
+from services import (
+    UnifiedForecastService, OpenAQService, NOAAWeatherService, WAQIService,
+    AQI_CATEGORIES, aqi_band, aqi_category_batch
+)
+from cache import tempo_cache, forecast_cache, openaq_cache, weather_cache, geocode_cache, response_cache
 from predictor import TEMPOPredictor
 from weather_service import WeatherService
 from breath_score import BreathScoreService
 from geocoding_service import GeocodingService
 from gemini_service import GeminiInsightsGenerator
+from firms_service import FirmsService
+import tempo_util
 
 # Initialize colorama for beautiful terminal output
 init(autoreset=True)
 
+# One PCG64 generator for every simulated series - variates are drawn in bulk
+_rng = np.random.default_rng()
+
+# Long-lived pool for fanning out upstream lookups - threads are reused across requests
+_EXECUTOR = ThreadPoolExecutor(max_workers=12, thread_name_prefix="clearskies-io")
+
+
+def _iso_series(end: datetime, step: timedelta, count: int) -> list:
+    """
+    ISO-8601 'Z' timestamps going back from `end` - index i is i * step earlier.
+    Formatted in one NumPy call, matching datetime.isoformat() for whole-second steps.
+    """
+    unit = 'us' if end.microsecond else 's'
+    points = np.datetime64(end, 'us') - np.arange(count) * np.timedelta64(step, 'us')
+    return [stamp + 'Z' for stamp in np.datetime_as_string(points, unit=unit).tolist()]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Poetic Logging - Because even logs should be beautiful
@@ -47,32 +74,45 @@ class ColorizedLogger:
     """
     Transform mundane logs into visual poetry.
     Every message tells a story, now in color.
+
+    Messages go through the queued 'clearskies' logger, so the terminal write
+    happens on the listener thread rather than in the request.
     """
 
+    _log = logging.getLogger('clearskies')
+
     @staticmethod
     def info(message: str):
         """Information - the color of sky."""
-        print(f"{Fore.CYAN}ℹ  {message}{Style.RESET_ALL}")
+        ColorizedLogger._log.info(f"{Fore.CYAN}ℹ  {message}{Style.RESET_ALL}")
 
     @staticmethod
     def success(message: str):
         """Success - the color of life."""
-        print(f"{Fore.GREEN}✓  {message}{Style.RESET_ALL}")
+        ColorizedLogger._log.info(f"{Fore.GREEN}✓  {message}{Style.RESET_ALL}")
 
     @staticmethod
     def warning(message: str):
         """Warning - the color of caution."""
-        print(f"{Fore.YELLOW}⚠  {message}{Style.RESET_ALL}")
+        ColorizedLogger._log.warning(f"{Fore.YELLOW}⚠  {message}{Style.RESET_ALL}")
 
     @staticmethod
     def error(message: str):
         """Error - the color of attention."""
-        print(f"{Fore.RED}✗  {message}{Style.RESET_ALL}")
+        ColorizedLogger._log.error(f"{Fore.RED}✗  {message}{Style.RESET_ALL}")
 
     @staticmethod
     def data(message: str):
         """Data - the color of insight."""
-        print(f"{Fore.MAGENTA}📊 {message}{Style.RESET_ALL}")
+        ColorizedLogger._log.info(f"{Fore.MAGENTA}📊 {message}{Style.RESET_ALL}")
+
+    @staticmethod
+    def traceback(message: str):
+        """
+        Traceback - the fine print, only when debug logging is on.
+        Call from an except block; the stack is formatted only if the record is emitted.
+        """
+        ColorizedLogger._log.debug(message, exc_info=True)
 
     @staticmethod
     def banner():
@@ -98,6 +138,36 @@ logger = ColorizedLogger()
 # Risk Classification and Health Guidance
 # ═══════════════════════════════════════════════════════════════════════════
 
+# One row per EPA band (same order as AQI_CATEGORIES):
+# (base risk, general advice, sensitive-group advice, activity recommendation)
+_AQI_GUIDANCE = (
+    ("minimal",
+     "Air quality is good. Perfect day to enjoy outdoor activities.",
+     "Safe for all sensitive groups",
+     "Perfect for all outdoor activities — enjoy your day!"),
+    ("low",
+     "Air quality is acceptable. Normal outdoor activities are fine for most people.",
+     "Unusually sensitive individuals should consider reducing prolonged outdoor exertion",
+     "Good for outdoor activities — normal schedule recommended"),
+    ("moderate",
+     "Sensitive groups should consider limiting prolonged outdoor exertion.",
+     "Children, elderly, and people with respiratory conditions should limit outdoor activities",
+     "Consider rescheduling intensive outdoor exercise to morning hours"),
+    ("high",
+     "Everyone should reduce prolonged or heavy outdoor exertion.",
+     "Sensitive groups should avoid all outdoor activities",
+     "Move outdoor activities indoors if possible"),
+    ("severe",
+     "Avoid all outdoor physical activities. Consider staying indoors.",
+     "Sensitive groups must remain indoors with air filtration",
+     "Cancel all outdoor activities — remain indoors"),
+    ("severe",
+     "Health alert: everyone should avoid all outdoor activities. Stay indoors.",
+     "Sensitive groups must remain indoors with air filtration",
+     "Cancel all outdoor activities — remain indoors"),
+)
+
+
 def _classify_risk(aqi: int, weather: dict, ground: dict) -> str:
     """
     Classify overall air quality risk based on AQI, weather, and ground validation.
@@ -107,18 +177,7 @@ def _classify_risk(aqi: int, weather: dict, ground: dict) -> str:
       - Stagnant weather conditions (low wind)
       - Ground sensor confirmation of poor air quality
     """
-    base_risk = "low"
-
-    if aqi <= 50:
-        base_risk = "minimal"
-    elif aqi <= 100:
-        base_risk = "low"
-    elif aqi <= 150:
-        base_risk = "moderate"
-    elif aqi <= 200:
-        base_risk = "high"
-    else:
-        base_risk = "severe"
+    base_risk = _AQI_GUIDANCE[aqi_band(aqi)][0]
 
     # Weather impact: stagnant air increases risk
     if weather:
@@ -134,46 +193,38 @@ def _classify_risk(aqi: int, weather: dict, ground: dict) -> str:
 
 def _get_general_advice(aqi: int) -> str:
     """General health advice based on AQI."""
-    if aqi <= 50:
-        return "Air quality is good. Perfect day to enjoy outdoor activities."
-    elif aqi <= 100:
-        return "Air quality is acceptable. Normal outdoor activities are fine for most people."
-    elif aqi <= 150:
-        return "Sensitive groups should consider limiting prolonged outdoor exertion."
-    elif aqi <= 200:
-        return "Everyone should reduce prolonged or heavy outdoor exertion."
-    elif aqi <= 300:
-        return "Avoid all outdoor physical activities. Consider staying indoors."
-    else:
-        return "Health alert: everyone should avoid all outdoor activities. Stay indoors."
+    return _AQI_GUIDANCE[aqi_band(aqi)][1]
 
 
 def _get_sensitive_group_advice(aqi: int) -> str:
     """Health advice specifically for sensitive groups."""
-    if aqi <= 50:
-        return "Safe for all sensitive groups"
-    elif aqi <= 100:
-        return "Unusually sensitive individuals should consider reducing prolonged outdoor exertion"
-    elif aqi <= 150:
-        return "Children, elderly, and people with respiratory conditions should limit outdoor activities"
-    elif aqi <= 200:
-        return "Sensitive groups should avoid all outdoor activities"
-    else:
-        return "Sensitive groups must remain indoors with air filtration"
+    return _AQI_GUIDANCE[aqi_band(aqi)][2]
 
 
 def _get_activity_recommendation(aqi: int) -> str:
     """Activity recommendations for tomorrow based on predicted AQI."""
-    if aqi <= 50:
-        return "Perfect for all outdoor activities — enjoy your day!"
-    elif aqi <= 100:
-        return "Good for outdoor activities — normal schedule recommended"
-    elif aqi <= 150:
-        return "Consider rescheduling intensive outdoor exercise to morning hours"
-    elif aqi <= 200:
-        return "Move outdoor activities indoors if possible"
-    else:
-        return "Cancel all outdoor activities — remain indoors"
+    return _AQI_GUIDANCE[aqi_band(aqi)][3]
+
+
+def _classify_trend(aqi_change: float) -> str:
+    """Direction of an AQI change - within ±5 counts as stable."""
+    if aqi_change < -5:
+        return 'improving'
+    if aqi_change > 5:
+        return 'deteriorating'
+    return 'stable'
+
+
+def _stamp_forecast(result: dict, lat: float, lon: float, city: Optional[str], location_details: dict) -> dict:
+    """Set the per-request fields of a /forecast body - its location echo and timestamps."""
+    current_time = datetime.utcnow().isoformat() + 'Z'
+    result['location'] = {
+        'coordinates': {'lat': round(lat, 4), 'lon': round(lon, 4), 'city': city},
+        'details': location_details
+    }
+    result['forecast_time'] = current_time
+    result['current_time'] = current_time
+    return result
 
 
 def _generate_alert_actions(aqi: int) -> list:
@@ -200,6 +251,46 @@ def _generate_alert_actions(aqi: int) -> list:
 # Application Factory
 # ═══════════════════════════════════════════════════════════════════════════
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson - every jsonify() gets the Rust encoder.
+    Keeps the default provider's key sorting and compact/pretty switch; anything
+    orjson refuses (e.g. integers beyond 64 bits) goes through the stdlib path.
+    """
+
+    def _options(self) -> int:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, option=self._options(), default=self.default).decode()
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options() | orjson.OPT_APPEND_NEWLINE
+        if self.compact is False or (self.compact is None and self._app.debug):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            body = orjson.dumps(obj, option=option, default=self.default)
+        except TypeError:
+            return super().response(*args, **kwargs)
+
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 def create_app() -> Flask:
     """
     Birth of the application.
@@ -208,6 +299,12 @@ def create_app() -> Flask:
     app = Flask(__name__)
     app.config['JSON_SORT_KEYS'] = config.JSON_SORT_KEYS
 
+    # Responses are encoded with orjson
+    app.json = OrjsonProvider(app)
+
+    # Flask indents every response in debug mode unless told otherwise
+    app.json.compact = config.JSON_COMPACT
+
     # Enable CORS for frontend integration (allow all origins for public API)
     CORS(app, resources={
         r"/*": {
@@ -221,13 +318,26 @@ def create_app() -> Flask:
     log = logging.getLogger('werkzeug')
     log.setLevel(logging.ERROR)
 
+    # Log writes happen on a background listener, never inside a request
+    start_queued_logging()
+
     # Register components
     register_error_handlers(app)
     register_routes(app)
 
+    # Open the newest TEMPO granule in the background so the first request doesn't pay for it
+    _EXECUTOR.submit(_warm_up)
+
     return app
 
 
+def _warm_up() -> None:
+    """Load the most recent TEMPO grid into the open-handle cache."""
+    tempo_file = tempo_util.get_most_recent_tempo_file(config.TEMPO_DATA_DIR)
+    if tempo_file:
+        tempo_util.preload_grid(tempo_file)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Input Validation - Guard the gates with elegance
 # ═══════════════════════════════════════════════════════════════════════════
@@ -399,7 +509,6 @@ def register_routes(app: Flask) -> None:
         Returns:
             Ground sensor measurements
         """
-        from services import OpenAQService
 
         radius = request.args.get('radius', 25, type=float)
         logger.data(f"Ground sensors: ({lat:.4f}, {lon:.4f}) [{radius}km]")
@@ -487,8 +596,6 @@ def register_routes(app: Flask) -> None:
         Returns:
             Breath score, mask recommendations, age-specific guidance
         """
-        from services import OpenAQService, NOAAWeatherService
-        from firms_service import FirmsService
 
         logger.data(f"Breath score request: ({lat:.4f}, {lon:.4f})")
 
@@ -547,7 +654,6 @@ def register_routes(app: Flask) -> None:
         Returns:
             AI-generated insights with personalized health recommendations
         """
-        from services import OpenAQService
 
         # Get coordinates (optional if AQI is directly provided)
         lat = request.args.get('lat', type=float)
@@ -599,23 +705,29 @@ def register_routes(app: Flask) -> None:
         location_name = city
 
         if lat is not None and lon is not None:
+
+            # The context lookups are independent - run them side by side
+            pollutants_future = _EXECUTOR.submit(OpenAQService.get_measurements, lat, lon)
+            weather_future = _EXECUTOR.submit(WeatherService.get_comprehensive_weather, lat, lon)
+            wildfire_future = _EXECUTOR.submit(FirmsService.get_active_fires, lat, lon, 100)
+            location_future = _EXECUTOR.submit(GeocodingService.reverse_geocode, lat, lon) if not location_name else None
+
             # Get pollutants from ground sensors
-            pollutants = OpenAQService.get_measurements(lat, lon)
+            pollutants = pollutants_future.result()
 
             # Get weather data
-            weather_data = WeatherService.get_comprehensive_weather(lat, lon)
+            weather_data = weather_future.result()
             if weather_data:
                 weather_data = weather_data.get('current', {})
 
             # Get location name if not provided
-            if not location_name:
-                location_info = GeocodingService.reverse_geocode(lat, lon)
+            if location_future:
+                location_info = location_future.result()
                 location_name = location_info.get('display_name', f"{lat:.2f}°, {lon:.2f}°")
 
             # Get breath score
-            from firms_service import FirmsService
-            wildfire_data = FirmsService.get_active_fires(lat, lon, 100)
-            breath_score_data = BreathScoreService.calculate_breath_score(
+            wildfire_data = wildfire_future.result()
+            breath_score_data = BreathScoreService.calculate_breath_summary(
                 aqi=aqi,
                 pollutants=pollutants,
                 wildfires_detected=wildfire_data['count'] > 0,
@@ -733,7 +845,6 @@ def register_routes(app: Flask) -> None:
         Returns:
             Side-by-side comparison of all metrics
         """
-        from services import WAQIService
 
         cities_param = request.args.get('cities', '')
 
@@ -799,7 +910,7 @@ def register_routes(app: Flask) -> None:
             weather_data = WeatherService.get_comprehensive_weather(lat, lon)
 
             # Calculate breath score (simplified version without wildfires for now)
-            breath_score_data = BreathScoreService.calculate_breath_score(
+            breath_score_data = BreathScoreService.calculate_breath_summary(
                 aqi=aqi,
                 pollutants={},  # WAQI already provides composite AQI
                 wildfires_detected=False,
@@ -857,17 +968,32 @@ def register_routes(app: Flask) -> None:
         Returns:
             Complete forecast with AQI prediction, risk classification, and health guidance
         """
-        from services import OpenAQService, WAQIService
-        from firms_service import FirmsService
 
         city = request.args.get('city', None)
 
         logger.data(f"Unified forecast: ({lat:.4f}, {lon:.4f}) {f'[{city}]' if city else ''}")
 
+        # Repeat polls for the same spot within a minute and a half reuse the composed response.
+        # The key is coarser than the echoed coordinates, so location and times are re-stamped.
+        cached_result = response_cache.get(lat, lon, city=city)
+        if cached_result is not None:
+            location_details = GeocodingService.reverse_geocode(lat, lon)
+            return jsonify(_stamp_forecast(cached_result, lat, lon, city, location_details))
+
+        # Every source below is independent I/O - start them all at once, then collect
+        waqi_future = _EXECUTOR.submit(WAQIService.get_real_time_aqi, lat, lon)
+        prediction_future = _EXECUTOR.submit(TEMPOPredictor.generate_forecast, lat, lon, city)
+        ground_future = _EXECUTOR.submit(OpenAQService.get_measurements, lat, lon)
+        weather_future = _EXECUTOR.submit(WeatherService.get_comprehensive_weather, lat, lon)
+        location_future = _EXECUTOR.submit(GeocodingService.reverse_geocode, lat, lon)
+        wildfire_future = _EXECUTOR.submit(FirmsService.get_active_fires, lat, lon, 100)
+
         # 1. Get REAL-TIME AQI from WAQI (works globally - same source as weather apps)
-        waqi_data = WAQIService.get_real_time_aqi(lat, lon)
+        waqi_data = waqi_future.result()
 
         if not waqi_data:
+            for future in (prediction_future, ground_future, weather_future, location_future, wildfire_future):
+                future.cancel()
             return jsonify({
                 'error': 'No AQI data available for this location',
                 'location': {'lat': lat, 'lon': lon, 'city': city},
@@ -876,24 +1002,24 @@ def register_routes(app: Flask) -> None:
 
         # 2. Try to get TEMPO satellite data (optional - only available for areas with downloaded data)
         try:
-            prediction = TEMPOPredictor.generate_forecast(lat, lon, city)
+            prediction = prediction_future.result()
             has_tempo = 'predicted_aqi' in prediction
         except:
             has_tempo = False
             prediction = {}
 
         # 3. Get current ground truth for validation (optional)
-        ground_data = OpenAQService.get_measurements(lat, lon)
+        ground_data = ground_future.result()
 
         # 4. Get comprehensive weather intelligence
-        weather_intelligence = WeatherService.get_comprehensive_weather(lat, lon)
+        weather_intelligence = weather_future.result()
 
         # 5. Get precise location information
-        location_details = GeocodingService.reverse_geocode(lat, lon)
+        location_details = location_future.result()
 
         # 6. Check for wildfires (optional)
         try:
-            wildfire_data = FirmsService.get_active_fires(lat, lon, 100)
+            wildfire_data = wildfire_future.result()
         except:
             wildfire_data = {'count': 0, 'closest_fire': None}
 
@@ -904,7 +1030,11 @@ def register_routes(app: Flask) -> None:
             dominant_pollutant = waqi_data['dominant_pollutant']
             confidence = 'very high'  # WAQI is the gold standard - used by all major weather apps
             data_source = 'WAQI (World Air Quality Index) - Same as iPhone Weather & Google'
-            category = WAQIService._get_aqi_category(aqi)
+
+            # One band lookup feeds the category and every guidance string below
+            band = aqi_band(aqi)
+            category = AQI_CATEGORIES[band]
+            _, general_advice, sensitive_advice, activity_advice = _AQI_GUIDANCE[band]
 
             # Enhanced risk classification
             risk_level = _classify_risk(aqi, weather_intelligence.get('current', {}), ground_data)
@@ -920,16 +1050,7 @@ def register_routes(app: Flask) -> None:
             )
 
             # Build unified response
-            from datetime import datetime
-            current_time = datetime.utcnow().isoformat() + 'Z'
-
             result = {
-                'location': {
-                    'coordinates': {'lat': round(lat, 4), 'lon': round(lon, 4), 'city': city},
-                    'details': location_details
-                },
-                'forecast_time': current_time,
-                'current_time': current_time,
                 'prediction': {
                     'aqi': aqi,
                     'category': category,
@@ -952,9 +1073,9 @@ def register_routes(app: Flask) -> None:
                     'astronomy': weather_intelligence.get('astronomy', {})
                 },
                 'health_guidance': {
-                    'general_public': prediction.get('advice', _get_general_advice(aqi)) if has_tempo else _get_general_advice(aqi),
-                    'sensitive_groups': _get_sensitive_group_advice(aqi),
-                    'outdoor_activities': _get_activity_recommendation(aqi)
+                    'general_public': prediction.get('advice', general_advice) if has_tempo else general_advice,
+                    'sensitive_groups': sensitive_advice,
+                    'outdoor_activities': activity_advice
                 },
                 'data_sources': {
                     'primary_aqi_source': data_source,
@@ -984,6 +1105,8 @@ def register_routes(app: Flask) -> None:
             }
 
             logger.success(f"Predicted AQI {aqi} ({confidence} confidence, {risk_level} risk) - Breath Score: {breath_score_data['breath_score']}/100")
+            response_cache.set(lat, lon, result, city=city)
+            _stamp_forecast(result, lat, lon, city, location_details)
         else:
             result = prediction
             logger.warning(f"Insufficient data for prediction at ({lat:.4f}, {lon:.4f})")
@@ -1011,9 +1134,6 @@ def register_routes(app: Flask) -> None:
         Returns:
             Comprehensive alert data with AI-powered insights
         """
-        from services import OpenAQService, NOAAWeatherService, WAQIService
-        from firms_service import FirmsService
-        from datetime import datetime, timedelta
 
         threshold = request.args.get('threshold', 100, type=int)
         city = request.args.get('city', None)
@@ -1022,10 +1142,18 @@ def register_routes(app: Flask) -> None:
 
         # Gather all data sources for comprehensive analysis
         try:
+            # The sources are independent I/O - start them all at once, then collect
+            waqi_future = _EXECUTOR.submit(WAQIService.get_real_time_aqi, lat, lon)
+            weather_future = _EXECUTOR.submit(NOAAWeatherService.get_conditions, lat, lon)
+            wildfire_future = _EXECUTOR.submit(FirmsService.get_active_fires, lat, lon, 100)
+            location_future = _EXECUTOR.submit(GeocodingService.reverse_geocode, lat, lon)
+
             # Get REAL-TIME AQI from WAQI (primary source - same as forecast endpoint)
-            waqi_data = WAQIService.get_real_time_aqi(lat, lon)
+            waqi_data = waqi_future.result()
 
             if not waqi_data or not waqi_data.get('aqi'):
+                for future in (weather_future, wildfire_future, location_future):
+                    future.cancel()
                 return jsonify({
                     'alert_active': False,
                     'message': 'No AQI data available for this location',
@@ -1036,18 +1164,12 @@ def register_routes(app: Flask) -> None:
             aqi = waqi_data['aqi']
             category = WAQIService._get_aqi_category(aqi)
 
-            # Try to get TEMPO satellite prediction for additional context
-            try:
-                prediction = TEMPOPredictor.generate_forecast(lat, lon, city)
-            except:
-                prediction = {}
-
             # Get current conditions
-            weather = NOAAWeatherService.get_conditions(lat, lon)
+            weather = weather_future.result()
 
             # Get wildfires
             try:
-                wildfires = FirmsService.get_active_fires(lat, lon, 100)
+                wildfires = wildfire_future.result()
             except:
                 wildfires = {'count': 0, 'wildfire_detected': False, 'closest_fire': None}
 
@@ -1073,21 +1195,23 @@ def register_routes(app: Flask) -> None:
 
             # Get location name
             try:
-                location_info = GeocodingService.reverse_geocode(lat, lon)
+                location_info = location_future.result()
                 location_name = location_info.get('city') or location_info.get('display_name') or f"{lat:.2f}°, {lon:.2f}°"
             except:
                 location_name = city or f"{lat:.2f}°, {lon:.2f}°"
 
         except Exception as e:
             logger.error(f"Error gathering alert data: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.traceback("Alert data traceback")
             return jsonify({
                 'error': 'Failed to generate comprehensive alerts',
                 'message': str(e),
                 'location': {'lat': lat, 'lon': lon}
             }), 500
 
+        # One timestamp for every alert in this response
+        now_iso = datetime.utcnow().isoformat() + 'Z'
+
         # Initialize alerts array
         alerts = []
         alert_count = 0
@@ -1095,57 +1219,20 @@ def register_routes(app: Flask) -> None:
         # ═══════════════════════════════════════════════════════════════════
         # 1. AI-POWERED PERSONALIZED ALERT (if AQI is concerning)
         # ═══════════════════════════════════════════════════════════════════
+        # The Gemini round trip dominates this endpoint - start it now and
+        # build the rule-based alerts while it is in flight
+        ai_future = None
         if aqi > 50:  # Generate AI insights for any non-perfect air quality
-            try:
-                ai_insights = GeminiInsightsGenerator.get_insights(
-                    lat=lat,
-                    lon=lon,
-                    aqi=aqi,
-                    pollutants=ground_data.get('data') if ground_data else None,
-                    location_name=location_name,
-                    weather=weather,
-                    breath_score=breath.get('score') if breath else None
-                )
-
-                if ai_insights.get('success'):
-                    insights = ai_insights['insights']
-                    severity = 'critical' if aqi > 200 else 'high' if aqi > 150 else 'moderate' if aqi > 100 else 'low'
-
-                    alerts.append({
-                        'id': 'ai_personalized',
-                        'type': 'ai_health',
-                        'severity': severity,
-                        'title': f"🧠 Personalized Health Guidance for {location_name}",
-                        'summary': insights.get('summary', ''),
-                        'message': insights.get('summary', ''),
-                        'health_recommendations': insights.get('health_recommendations', []),
-                        'contextual_insights': insights.get('contextual_insights', []),
-                        'actionable_tips': insights.get('actionable_tips', []),
-                        'ai_powered': True,
-                        'ai_model': 'Google Gemini 2.5 Flash',
-                        'full_response': insights.get('full_response', ''),
-                        'timestamp': datetime.utcnow().isoformat() + 'Z'
-                    })
-                    alert_count += 1
-                else:
-                    # Use fallback if AI fails
-                    fallback = ai_insights.get('fallback_insights', {})
-                    if fallback:
-                        alerts.append({
-                            'id': 'health_guidance',
-                            'type': 'health',
-                            'severity': 'moderate' if aqi > 100 else 'low',
-                            'title': f"Health Guidance - AQI {aqi}",
-                            'summary': fallback.get('summary', ''),
-                            'health_recommendations': fallback.get('health_recommendations', []),
-                            'actionable_tips': fallback.get('actionable_tips', []),
-                            'ai_powered': False,
-                            'timestamp': datetime.utcnow().isoformat() + 'Z'
-                        })
-                        alert_count += 1
-            except Exception as e:
-                logger.error(f"AI insights generation failed: {str(e)}")
-                # Continue with other alerts even if AI fails
+            ai_future = _EXECUTOR.submit(
+                GeminiInsightsGenerator.get_insights,
+                lat=lat,
+                lon=lon,
+                aqi=aqi,
+                pollutants=ground_data.get('data') if ground_data else None,
+                location_name=location_name,
+                weather=weather,
+                breath_score=breath.get('score') if breath else None
+            )
 
         # ═══════════════════════════════════════════════════════════════════
         # 2. AQI THRESHOLD ALERT (Traditional)
@@ -1165,7 +1252,7 @@ def register_routes(app: Flask) -> None:
                 'health_guidance': _get_health_advice(aqi),
                 'actions': _generate_alert_actions(aqi),
                 'affected_groups': ['General Public', 'Sensitive Groups'] if aqi > 150 else ['Sensitive Groups'],
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': now_iso
             })
             alert_count += 1
 
@@ -1200,7 +1287,7 @@ def register_routes(app: Flask) -> None:
                     ],
                     'affected_groups': ['Everyone', 'Especially sensitive groups'],
                     'source': 'NASA FIRMS (Fire Information for Resource Management System)',
-                    'timestamp': datetime.utcnow().isoformat() + 'Z'
+                    'timestamp': now_iso
                 })
                 alert_count += 1
 
@@ -1222,7 +1309,7 @@ def register_routes(app: Flask) -> None:
                         "Bring an umbrella or rain jacket",
                         "Plan for wet conditions if going outside"
                     ],
-                    'timestamp': datetime.utcnow().isoformat() + 'Z'
+                    'timestamp': now_iso
                 })
                 alert_count += 1
 
@@ -1245,7 +1332,7 @@ def register_routes(app: Flask) -> None:
                             "Never leave children or pets in vehicles"
                         ],
                         'affected_groups': ['Everyone', 'Elderly', 'Children', 'Outdoor Workers'],
-                        'timestamp': datetime.utcnow().isoformat() + 'Z'
+                        'timestamp': now_iso
                     })
                     alert_count += 1
                 elif temp < 20:  # Very cold
@@ -1263,7 +1350,7 @@ def register_routes(app: Flask) -> None:
                             "Dress in warm layers"
                         ],
                         'affected_groups': ['People with asthma', 'Elderly', 'Children'],
-                        'timestamp': datetime.utcnow().isoformat() + 'Z'
+                        'timestamp': now_iso
                     })
                     alert_count += 1
 
@@ -1286,10 +1373,55 @@ def register_routes(app: Flask) -> None:
                     "Plan outdoor activities for times with better air quality",
                     "Consider alternative indoor exercise options"
                 ],
-                'timestamp': datetime.utcnow().isoformat() + 'Z'
+                'timestamp': now_iso
             })
             alert_count += 1
 
+        # AI alert leads the list once the Gemini call comes back
+        if ai_future is not None:
+            try:
+                ai_insights = ai_future.result()
+
+                if ai_insights.get('success'):
+                    insights = ai_insights['insights']
+                    severity = 'critical' if aqi > 200 else 'high' if aqi > 150 else 'moderate' if aqi > 100 else 'low'
+
+                    alerts.insert(0, {
+                        'id': 'ai_personalized',
+                        'type': 'ai_health',
+                        'severity': severity,
+                        'title': f"🧠 Personalized Health Guidance for {location_name}",
+                        'summary': insights.get('summary', ''),
+                        'message': insights.get('summary', ''),
+                        'health_recommendations': insights.get('health_recommendations', []),
+                        'contextual_insights': insights.get('contextual_insights', []),
+                        'actionable_tips': insights.get('actionable_tips', []),
+                        'ai_powered': True,
+                        'ai_model': 'Google Gemini 2.5 Flash',
+                        'full_response': insights.get('full_response', ''),
+                        'timestamp': now_iso
+                    })
+                    alert_count += 1
+                else:
+                    # Use fallback if AI fails
+                    fallback = ai_insights.get('fallback_insights', {})
+                    if fallback:
+                        alerts.insert(0, {
+                            'id': 'health_guidance',
+                            'type': 'health',
+                            'severity': 'moderate' if aqi > 100 else 'low',
+                            'title': f"Health Guidance - AQI {aqi}",
+                            'summary': fallback.get('summary', ''),
+                            'health_recommendations': fallback.get('health_recommendations', []),
+                            'actionable_tips': fallback.get('actionable_tips', []),
+                            'ai_powered': False,
+                            'timestamp': now_iso
+                        })
+                        alert_count += 1
+            except Exception as e:
+                logger.error(f"AI insights generation failed: {str(e)}")
+                # Continue with other alerts even if AI fails
+
         # ═══════════════════════════════════════════════════════════════════
         # Build comprehensive response
         # ═══════════════════════════════════════════════════════════════════
@@ -1311,7 +1443,7 @@ def register_routes(app: Flask) -> None:
                 'weather_condition': weather.get('conditions') if weather else None,
                 'temperature': weather.get('temp') if weather else None
             },
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
+            'timestamp': now_iso
         }
 
         if alert_count > 0:
@@ -1338,8 +1470,6 @@ def register_routes(app: Flask) -> None:
         Returns:
             Time-series AQI data
         """
-        from services import WAQIService
-        from datetime import datetime, timedelta
 
         days = request.args.get('days', 7, type=int)
 
@@ -1356,24 +1486,25 @@ def register_routes(app: Flask) -> None:
             })
 
         # Simulate historical data using current AQI (real historical storage coming soon)
-        history_data = []
+        # 4 data points per day, generated as whole arrays - index i is i * 6 hours ago
         current_aqi = waqi_data['aqi']
-
-        for i in range(days * 4):  # 4 data points per day
-            timestamp = datetime.utcnow() - timedelta(hours=i * 6)
-            # Add small random variation to make it look more realistic
-            import random
-            aqi_variation = current_aqi + random.randint(-10, 10)
-            aqi_variation = max(0, min(500, aqi_variation))  # Keep in valid range
-
-            history_data.append({
-                'timestamp': timestamp.isoformat() + 'Z',
-                'aqi': aqi_variation,
-                'category': WAQIService._get_aqi_category(aqi_variation),
+        now = datetime.utcnow()
+        n_points = max(days, 0) * 4
+
+        # Add small random variation to make it look more realistic
+        aqi_values = np.clip(current_aqi + _rng.integers(-10, 11, size=n_points), 0, 500)
+        categories = aqi_category_batch(aqi_values)
+        timestamps = _iso_series(now, timedelta(hours=6), n_points)
+
+        history_data = [
+            {
+                'timestamp': timestamps[i],
+                'aqi': int(aqi_values[i]),
+                'category': str(categories[i]),
                 'source': 'WAQI (Real-time)'
-            })
-
-        history_data.reverse()  # Oldest first
+            }
+            for i in reversed(range(n_points))  # Oldest first
+        ]
 
         logger.success(f"Retrieved {len(history_data)} historical data points")
 
@@ -1403,18 +1534,19 @@ def register_routes(app: Flask) -> None:
         Returns:
             Temporal comparison data with trends and charts
         """
-        from services import WAQIService
-        from datetime import timedelta
-        import random
 
         logger.data(f"Temporal comparison request: ({lat:.4f}, {lon:.4f})")
 
         # Get current real-time AQI from WAQI
         waqi_data = WAQIService.get_real_time_aqi(lat, lon)
 
+        # One clock reading for the response - every point below is offset from it
+        current_time = datetime.utcnow()
+        current_iso = current_time.isoformat() + 'Z'
+
         result = {
             'location': {'lat': round(lat, 4), 'lon': round(lon, 4)},
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': current_iso,
             'comparison': {
                 'current': None,
                 'day_ago': None,
@@ -1430,17 +1562,18 @@ def register_routes(app: Flask) -> None:
             return jsonify(result)
 
         current_aqi = waqi_data['aqi']
-        current_time = datetime.utcnow()
 
         # Current data
         result['comparison']['current'] = {
             'aqi': current_aqi,
-            'timestamp': current_time.isoformat() + 'Z',
+            'timestamp': current_iso,
             'category': WAQIService._get_aqi_category(current_aqi)
         }
 
+        # Both variations in one draw: 24h (slight bias toward improvement) and 7d (larger)
+        day_ago_variation_pct, week_ago_variation_pct = _rng.uniform([-0.25, -0.40], [0.20, 0.30])
+
         # Simulate 24h ago data using percentage variation (±10-25%)
-        day_ago_variation_pct = random.uniform(-0.25, 0.20)  # Slight bias toward improvement
         day_ago_aqi = max(5, min(500, int(current_aqi * (1 + day_ago_variation_pct))))
         result['comparison']['day_ago'] = {
             'aqi': day_ago_aqi,
@@ -1450,18 +1583,12 @@ def register_routes(app: Flask) -> None:
 
         # Calculate 24h trend
         aqi_diff_24h = current_aqi - day_ago_aqi
-        if aqi_diff_24h < -5:
-            result['comparison']['trend_24h'] = 'improving'
-        elif aqi_diff_24h > 5:
-            result['comparison']['trend_24h'] = 'deteriorating'
-        else:
-            result['comparison']['trend_24h'] = 'stable'
+        result['comparison']['trend_24h'] = _classify_trend(aqi_diff_24h)
 
         result['comparison']['change_24h'] = round(aqi_diff_24h, 1)
         result['comparison']['change_24h_percent'] = round((aqi_diff_24h / day_ago_aqi) * 100, 1) if day_ago_aqi > 0 else 0
 
         # Simulate 7 days ago data using percentage variation (±20-40%)
-        week_ago_variation_pct = random.uniform(-0.40, 0.30)  # Larger variation for weekly
         week_ago_aqi = max(5, min(500, int(current_aqi * (1 + week_ago_variation_pct))))
         result['comparison']['week_ago'] = {
             'aqi': week_ago_aqi,
@@ -1471,39 +1598,34 @@ def register_routes(app: Flask) -> None:
 
         # Calculate 7d trend
         aqi_diff_7d = current_aqi - week_ago_aqi
-        if aqi_diff_7d < -5:
-            result['comparison']['trend_7d'] = 'improving'
-        elif aqi_diff_7d > 5:
-            result['comparison']['trend_7d'] = 'deteriorating'
-        else:
-            result['comparison']['trend_7d'] = 'stable'
+        result['comparison']['trend_7d'] = _classify_trend(aqi_diff_7d)
 
         result['comparison']['change_7d'] = round(aqi_diff_7d, 1)
         result['comparison']['change_7d_percent'] = round((aqi_diff_7d / week_ago_aqi) * 100, 1) if week_ago_aqi > 0 else 0
 
-        # Generate 7-day history chart data (28 points = 4 per day)
-        history_data = []
-        for i in range(28):
-            hours_ago = i * 6  # Every 6 hours
-            timestamp = current_time - timedelta(hours=hours_ago)
-
-            # Create realistic variation: start from week_ago_aqi, gradually trend to current_aqi
-            progress = 1 - (i / 28)  # 1.0 (current) to 0.0 (week ago)
-            base_aqi = week_ago_aqi + (current_aqi - week_ago_aqi) * progress
-
-            # Add some random noise
-            noise = random.randint(-8, 8)
-            point_aqi = max(0, min(500, int(base_aqi + noise)))
-
-            history_data.append({
-                'timestamp': timestamp.isoformat() + 'Z',
-                'aqi': point_aqi,
-                'category': WAQIService._get_aqi_category(point_aqi)
-            })
-
-        # Reverse to oldest first
-        history_data.reverse()
-        result['comparison']['history'] = history_data
+        # Generate 7-day history chart data (28 points = 4 per day, every 6 hours)
+        # Computed as whole arrays - index i is i * 6 hours ago
+        steps = np.arange(28)
+
+        # Create realistic variation: start from week_ago_aqi, gradually trend to current_aqi
+        progress = 1 - (steps / 28)  # 1.0 (current) to 0.0 (week ago)
+        base_aqi = week_ago_aqi + (current_aqi - week_ago_aqi) * progress
+
+        # Add some random noise
+        noise = _rng.integers(-8, 9, size=steps.size)
+        point_aqis = np.clip((base_aqi + noise).astype(int), 0, 500)
+        categories = aqi_category_batch(point_aqis)
+        timestamps = _iso_series(current_time, timedelta(hours=6), steps.size)
+
+        # Oldest first
+        result['comparison']['history'] = [
+            {
+                'timestamp': timestamps[i],
+                'aqi': int(point_aqis[i]),
+                'category': str(categories[i])
+            }
+            for i in reversed(range(steps.size))
+        ]
 
         logger.success(f"Temporal comparison: Current AQI {current_aqi}, 24h trend: {result['comparison']['trend_24h']}")
 
@@ -1526,7 +1648,6 @@ def register_routes(app: Flask) -> None:
         Returns:
             Active wildfire data with exact coordinates and precise location details
         """
-        from firms_service import FirmsService
 
         radius = request.args.get('radius', 100, type=int)
 
@@ -1599,7 +1720,11 @@ def register_routes(app: Flask) -> None:
         return jsonify({
             'caches': {
                 'tempo': tempo_cache.stats,
-                'forecast': forecast_cache.stats
+                'forecast': forecast_cache.stats,
+                'openaq': openaq_cache.stats,
+                'weather': weather_cache.stats,
+                'geocode': geocode_cache.stats,
+                'response': response_cache.stats
             },
             'timestamp': datetime.utcnow().isoformat() + 'Z'
         })
@@ -1612,6 +1737,10 @@ def register_routes(app: Flask) -> None:
         """
         tempo_cache.clear()
         forecast_cache.clear()
+        openaq_cache.clear()
+        weather_cache.clear()
+        geocode_cache.clear()
+        response_cache.clear()
 
         logger.info("All caches cleared")
 
@@ -1687,11 +1816,8 @@ if __name__ == '__main__':
     print(f"\n{Fore.YELLOW}Data Sources Connected:{Style.RESET_ALL}")
 
     # Check TEMPO availability
-    import tempo_util
     tempo_file = tempo_util.get_most_recent_tempo_file(config.TEMPO_DATA_DIR)
     if tempo_file:
-        import os
-        from datetime import datetime
         file_time = datetime.fromtimestamp(os.path.getmtime(tempo_file))
         print(f"  {Fore.GREEN}✓{Fore.WHITE} NASA TEMPO Satellite    {Fore.CYAN}(Last update: {file_time.strftime('%Y-%m-%d %H:%M UTC')})")
     else:
@@ -14,7 +14,7 @@ Scientifically calibrated using:
 ═══════════════════════════════════════════════════════════════════════════
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import math
 
 
@@ -120,25 +120,10 @@ class BreathScoreService:
             Complete breath score analysis with mask recommendations
         """
 
-        # Base score from AQI (inverted scale)
-        base_score = BreathScoreService._aqi_to_breath_score(aqi)
-
-        # Apply pollutant modifiers
-        pollutant_penalty = 0
-        if pollutants:
-            pollutant_penalty = BreathScoreService._calculate_pollutant_penalty(pollutants)
-
-        # Apply wildfire penalty
-        wildfire_penalty = 0
-        if wildfires_detected:
-            wildfire_penalty = BreathScoreService._calculate_wildfire_penalty(wildfire_distance)
-
-        # Apply weather modifiers
-        weather_modifier = BreathScoreService._calculate_weather_modifier(humidity, temperature)
-
-        # Final breath score calculation
-        breath_score = base_score - pollutant_penalty - wildfire_penalty + weather_modifier
-        breath_score = max(0, min(100, breath_score))  # Clamp 0-100
+        breath_score, base_score, pollutant_penalty, wildfire_penalty, weather_modifier = \
+            BreathScoreService._score_components(
+                aqi, pollutants, wildfires_detected, wildfire_distance, humidity, temperature
+            )
 
         # Get mask recommendation
         mask_rec = BreathScoreService._get_mask_recommendation(breath_score)
@@ -167,6 +152,73 @@ class BreathScoreService:
             'timestamp': 'real-time'
         }
 
+    @staticmethod
+    def calculate_breath_summary(
+        aqi: float,
+        pollutants: Dict[str, Any] = None,
+        wildfires_detected: bool = False,
+        wildfire_distance: float = None,
+        humidity: float = 50,
+        temperature: float = 70
+    ) -> Dict[str, Any]:
+        """
+        Breath score, rating and mask only - for callers that show nothing else.
+        Skips the breakdown, risk factors and guidance that calculate_breath_score builds.
+
+        Args:
+            Same as calculate_breath_score
+
+        Returns:
+            Dictionary with breath_score, rating and mask
+        """
+        breath_score = BreathScoreService._score_components(
+            aqi, pollutants, wildfires_detected, wildfire_distance, humidity, temperature
+        )[0]
+        mask_rec = BreathScoreService._get_mask_recommendation(breath_score)
+
+        return {
+            'breath_score': round(breath_score, 1),
+            'rating': mask_rec['rating'],
+            'mask': mask_rec
+        }
+
+    @staticmethod
+    def _score_components(
+        aqi: float,
+        pollutants: Dict[str, Any],
+        wildfires_detected: bool,
+        wildfire_distance: float,
+        humidity: float,
+        temperature: float
+    ) -> Tuple[float, float, float, float, float]:
+        """
+        Clamped breath score and the four terms it is built from.
+
+        Returns:
+            (breath_score, base_score, pollutant_penalty, wildfire_penalty, weather_modifier)
+        """
+        # Base score from AQI (inverted scale)
+        base_score = BreathScoreService._aqi_to_breath_score(aqi)
+
+        # Apply pollutant modifiers
+        pollutant_penalty = 0
+        if pollutants:
+            pollutant_penalty = BreathScoreService._calculate_pollutant_penalty(pollutants)
+
+        # Apply wildfire penalty
+        wildfire_penalty = 0
+        if wildfires_detected:
+            wildfire_penalty = BreathScoreService._calculate_wildfire_penalty(wildfire_distance)
+
+        # Apply weather modifiers
+        weather_modifier = BreathScoreService._calculate_weather_modifier(humidity, temperature)
+
+        # Final breath score calculation
+        breath_score = base_score - pollutant_penalty - wildfire_penalty + weather_modifier
+        breath_score = max(0, min(100, breath_score))  # Clamp 0-100
+
+        return breath_score, base_score, pollutant_penalty, wildfire_penalty, weather_modifier
+
     @staticmethod
     def _aqi_to_breath_score(aqi: float) -> float:
         """
@@ -3,12 +3,25 @@ Intelligent Caching Layer
 Location-aware cache with automatic expiration - because satellite data evolves.
 """
 from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
 from functools import wraps
 import hashlib
-import json
-from typing import Any, Callable
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+import orjson
+
 from config import config
 
+logger = logging.getLogger('clearskies.' + __name__)
+
+# Background refreshes for stale-while-revalidate caches
+_REFRESH_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
 
 class LocationCache:
     """
@@ -16,17 +29,21 @@ class LocationCache:
     Optimized for lat/lon queries where precision matters.
     """
 
-    def __init__(self, ttl: int = None, max_size: int = None):
+    def __init__(self, ttl: int = None, max_size: int = None, coalesce_misses: bool = False):
         """
         Initialize the location-based cache.
 
         Args:
             ttl: Time-to-live in seconds (default from config)
             max_size: Maximum number of cached entries (default from config)
+            coalesce_misses: Let only one caller per key go upstream on a miss
         """
         self.ttl = ttl or config.CACHE_TTL_SECONDS
         self.max_size = max_size or config.CACHE_MAX_SIZE
+        self.coalesce_misses = coalesce_misses
         self._cache = TTLCache(maxsize=self.max_size, ttl=self.ttl)
+        self._lock = threading.Lock()  # TTLCache is not thread-safe on its own
+        self._key_locks = {}  # key -> [lock, waiters] while a miss is being filled
 
     def _make_key(self, lat: float, lon: float, **kwargs) -> str:
         """
@@ -53,22 +70,47 @@ class LocationCache:
         }
 
         # Hash for compact, collision-resistant keys
-        key_string = json.dumps(key_data, sort_keys=True)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        key_bytes = orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        return hashlib.md5(key_bytes).hexdigest()
 
     def get(self, lat: float, lon: float, **kwargs) -> Any:
-        """Retrieve cached data for location."""
+        """Retrieve cached data for location - a copy, so callers may modify it."""
         key = self._make_key(lat, lon, **kwargs)
-        return self._cache.get(key)
+        with self._lock:
+            value = self._cache.get(key)
+        return deepcopy(value)
 
     def set(self, lat: float, lon: float, value: Any, **kwargs) -> None:
-        """Store data in cache for location."""
+        """Store a copy of data in cache for location."""
+        key = self._make_key(lat, lon, **kwargs)
+        value = deepcopy(value)
+        with self._lock:
+            self._cache[key] = value
+
+    @contextmanager
+    def single_flight(self, lat: float, lon: float, **kwargs) -> Iterator[None]:
+        """
+        Serialize misses for one location - the first caller fills the entry,
+        the rest wait for it and then read it from the cache.
+        """
         key = self._make_key(lat, lon, **kwargs)
-        self._cache[key] = value
+        with self._lock:
+            slot = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+
+        try:
+            with slot[0]:
+                yield
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if not slot[1]:
+                    del self._key_locks[key]
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
 
     @property
     def stats(self) -> dict:
@@ -81,15 +123,110 @@ class LocationCache:
         }
 
 
+class StaleWhileRevalidateCache(LocationCache):
+    """
+    Location cache that keeps serving an entry after it goes stale.
+
+    An entry is fresh for `ttl` seconds. After that, until `stale_ttl`, it is
+    still returned immediately while a background refresh replaces it. Only a
+    miss, or an entry older than `stale_ttl`, makes the caller wait upstream.
+    """
+
+    def __init__(self, ttl: int, stale_ttl: int, max_size: int = None):
+        """
+        Initialize the stale-while-revalidate cache.
+
+        Args:
+            ttl: Seconds an entry is served without triggering a refresh
+            stale_ttl: Seconds an entry may be served at all (hard expiry)
+            max_size: Maximum number of cached entries (default from config)
+        """
+        # The underlying TTLCache evicts at the hard expiry
+        super().__init__(ttl=stale_ttl, max_size=max_size)
+        self.fresh_ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._inflight = set()
+
+    def get_entry(self, lat: float, lon: float, **kwargs) -> Optional[Tuple[Any, bool]]:
+        """Retrieve (copy of value, is_fresh) for location, or None on a miss."""
+        key = self._make_key(lat, lon, **kwargs)
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        value, fresh_until = entry
+        return deepcopy(value), time.monotonic() < fresh_until
+
+    def get(self, lat: float, lon: float, **kwargs) -> Any:
+        """Retrieve cached data for location, fresh or stale."""
+        entry = self.get_entry(lat, lon, **kwargs)
+        return entry[0] if entry else None
+
+    def set(self, lat: float, lon: float, value: Any, **kwargs) -> None:
+        """Store a copy of data in cache for location, fresh for the next `ttl` seconds."""
+        key = self._make_key(lat, lon, **kwargs)
+        value = deepcopy(value)
+        with self._lock:
+            self._cache[key] = (value, time.monotonic() + self.fresh_ttl)
+
+    def revalidate(self, refresh: Callable[[], Any], lat: float, lon: float, **kwargs) -> None:
+        """
+        Refresh an entry in the background, at most one refresh per key at a time.
+
+        Args:
+            refresh: Zero-argument callable producing the new value
+            lat: Latitude
+            lon: Longitude
+            **kwargs: Additional key parameters
+        """
+        key = self._make_key(lat, lon, **kwargs)
+        with self._lock:
+            if key in self._inflight:
+                return
+            self._inflight.add(key)
+
+        def run():
+            try:
+                result = refresh()
+                if result is not None:
+                    self.set(lat, lon, result, **kwargs)
+            except Exception as e:
+                logger.error(f"Background cache refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._inflight.discard(key)
+
+        _REFRESH_EXECUTOR.submit(run)
+
+    @property
+    def stats(self) -> dict:
+        """Return cache statistics."""
+        stats = super().stats
+        stats['ttl_seconds'] = self.fresh_ttl
+        stats['stale_ttl_seconds'] = self.stale_ttl
+        stats['refreshing'] = len(self._inflight)
+        return stats
+
+
 # Global cache instances
-tempo_cache = LocationCache()
+tempo_cache = StaleWhileRevalidateCache(ttl=1800, stale_ttl=7200)  # Satellite granules update slowly
 forecast_cache = LocationCache(ttl=1800)  # 30 min for forecast data
+openaq_cache = StaleWhileRevalidateCache(ttl=300, stale_ttl=3600)  # Ground sensors
+weather_cache = StaleWhileRevalidateCache(ttl=600, stale_ttl=1800)  # Open-Meteo conditions
+geocode_cache = LocationCache(ttl=86400, coalesce_misses=True)  # Street addresses rarely change; Nominatim allows 1 req/s
+response_cache = LocationCache(ttl=90, max_size=512)  # Composed /forecast responses for repeat polls
 
 
 def cached(cache_instance: LocationCache):
     """
     Decorator for caching function results based on lat/lon arguments.
 
+    Extra positional arguments are part of the key. Every caller gets its own
+    copy of the result, never the cached object itself. With a
+    StaleWhileRevalidateCache, stale hits are returned at once and refreshed
+    in the background.
+
     Usage:
         @cached(tempo_cache)
         def get_pollution_data(lat, lon):
@@ -97,21 +234,44 @@ def cached(cache_instance: LocationCache):
             return data
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(lat: float, lon: float, *args, **kwargs):
-            # Try to get from cache
-            cached_result = cache_instance.get(lat, lon, **kwargs)
-            if cached_result is not None:
-                return cached_result
-
-            # Cache miss - execute function
+        def _fill(lat, lon, args, kwargs, key_params):
             result = func(lat, lon, *args, **kwargs)
 
             # Store in cache if result is valid
             if result is not None:
-                cache_instance.set(lat, lon, result, **kwargs)
+                cache_instance.set(lat, lon, result, **key_params)
 
             return result
 
+        @wraps(func)
+        def wrapper(lat: float, lon: float, *args, **kwargs):
+            key_params = dict(kwargs, _args=list(args)) if args else kwargs
+
+            # Try to get from cache
+            if isinstance(cache_instance, StaleWhileRevalidateCache):
+                entry = cache_instance.get_entry(lat, lon, **key_params)
+                if entry is not None:
+                    cached_result, is_fresh = entry
+                    if not is_fresh:
+                        cache_instance.revalidate(
+                            lambda: func(lat, lon, *args, **kwargs), lat, lon, **key_params
+                        )
+                    return cached_result
+            else:
+                cached_result = cache_instance.get(lat, lon, **key_params)
+                if cached_result is not None:
+                    return cached_result
+
+            # Concurrent misses for one location share a single upstream call
+            if cache_instance.coalesce_misses:
+                with cache_instance.single_flight(lat, lon, **key_params):
+                    cached_result = cache_instance.get(lat, lon, **key_params)
+                    if cached_result is not None:
+                        return cached_result
+                    return _fill(lat, lon, args, kwargs, key_params)
+
+            # Cache miss - execute function
+            return _fill(lat, lon, args, kwargs, key_params)
+
         return wrapper
     return decorator
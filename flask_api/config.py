@@ -47,7 +47,7 @@ class Config:
 
     # Response Format
     JSON_SORT_KEYS = False  # Preserve logical ordering
-    JSON_COMPACT = False    # Human-readable formatting
+    JSON_COMPACT = os.getenv("PRETTY_JSON", "") != "1"  # Set PRETTY_JSON=1 for indented responses while debugging
 
     @classmethod
     def validate_coordinates(cls, lat: float, lon: float) -> tuple[bool, str]:
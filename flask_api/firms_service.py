@@ -30,12 +30,18 @@ Data source: NASA FIRMS API
 ═══════════════════════════════════════════════════════════════════════════
 """
 
-import requests
+import csv
+import logging
 import os
+from io import StringIO
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import math
+import numpy as np
 from config import config
+from http_session import session_for
+
+logger = logging.getLogger('clearskies.' + __name__)
 
 
 class FirmsService:
@@ -88,6 +94,30 @@ class FirmsService:
 
         return R * c
 
+    @staticmethod
+    def _calculate_distances(lat: float, lon: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        Vectorized Haversine distance from one point to many.
+
+        Args:
+            lat, lon: Origin coordinates
+            lats, lons: Arrays of destination coordinates
+
+        Returns:
+            Array of distances in kilometers
+        """
+        R = 6371.0
+
+        lat1_rad = math.radians(lat)
+        lat2_rad = np.radians(lats)
+        delta_lat = lat2_rad - lat1_rad
+        delta_lon = np.radians(lons - lon)
+
+        a = np.sin(delta_lat / 2)**2 + math.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2)**2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+        return R * c
+
     @staticmethod
     def _classify_fire_severity(brightness: float, confidence: float) -> str:
         """
@@ -109,6 +139,28 @@ class FirmsService:
         else:
             return 'low'
 
+    @staticmethod
+    def _classify_fire_severity_batch(brightness: np.ndarray, confidence: np.ndarray) -> np.ndarray:
+        """
+        Vectorized _classify_fire_severity - same thresholds, first match wins.
+
+        Args:
+            brightness: Array of brightness temperatures in Kelvin
+            confidence: Array of confidence percentages (0-100)
+
+        Returns:
+            Array of severity classifications
+        """
+        return np.select(
+            [
+                (brightness >= 380) & (confidence >= 80),
+                (brightness >= 360) | (confidence >= 70),
+                (brightness >= 340) | (confidence >= 50)
+            ],
+            ['extreme', 'high', 'moderate'],
+            default='low'
+        )
+
     @staticmethod
     def get_active_fires(lat: float, lon: float, radius_km: int = 100) -> Dict[str, Any]:
         """
@@ -134,16 +186,17 @@ class FirmsService:
             # Format: https://firms.modaps.eosdis.nasa.gov/api/area/csv/{MAP_KEY}/{source}/{radius}/{lat},{lon}/{day_range}
             url = f"{FirmsService.FIRMS_API}/{FirmsService.MAP_KEY}/{source}/{radius_km}/{lat},{lon}/{day_range}"
 
-            print(f"FIRMS API Request: {url.replace(FirmsService.MAP_KEY, '***KEY***')}")  # Log without exposing key
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FIRMS API Request: %s", url.replace(FirmsService.MAP_KEY, '***KEY***'))  # Log without exposing key
 
             # Make request with timeout
-            response = requests.get(url, timeout=15)
+            response = session_for(url).get(url, timeout=15)
 
             # Check if we have a valid API key and successful response
             if response.status_code != 200:
-                print(f"FIRMS API returned status code: {response.status_code}")
+                logger.warning(f"FIRMS API returned status code: {response.status_code}")
                 if FirmsService.MAP_KEY == "DEMO_MAP_KEY":
-                    print("Using mock data - Configure FIRMS_MAP_KEY environment variable for real data")
+                    logger.warning("Using mock data - Configure FIRMS_MAP_KEY environment variable for real data")
                 return FirmsService._get_mock_wildfire_data(lat, lon, radius_km)
 
             # Parse CSV response
@@ -156,7 +209,7 @@ class FirmsService:
 
         except Exception as e:
             # Gracefully fallback to mock data
-            print(f"FIRMS API error: {e}. Using mock data.")
+            logger.error(f"FIRMS API error: {e}. Using mock data.")
             return FirmsService._get_mock_wildfire_data(lat, lon, radius_km)
 
     @staticmethod
@@ -172,40 +225,50 @@ class FirmsService:
         Returns:
             Structured wildfire data dictionary
         """
-        import csv
-        from io import StringIO
-
-        fires = []
-        reader = csv.DictReader(StringIO(csv_text))
-
-        for row in reader:
-            fire_lat = float(row['latitude'])
-            fire_lon = float(row['longitude'])
-
-            # Calculate distance from query point
-            distance = FirmsService._calculate_distance(origin_lat, origin_lon, fire_lat, fire_lon)
-
-            # Only include fires within radius
-            if distance <= max_radius:
-                brightness = float(row.get('bright_ti4', row.get('brightness', 0)))
-                confidence = float(row.get('confidence', 0))
-
-                fires.append({
-                    'latitude': fire_lat,
-                    'longitude': fire_lon,
-                    'brightness': brightness,
-                    'confidence': confidence,
-                    'scan': float(row.get('scan', 0)),
-                    'track': float(row.get('track', 0)),
-                    'acq_date': row.get('acq_date'),
-                    'acq_time': row.get('acq_time'),
-                    'satellite': row.get('satellite', 'Unknown'),
-                    'distance_km': round(distance, 2),
-                    'severity': FirmsService._classify_fire_severity(brightness, confidence)
-                })
-
-        # Sort by distance
-        fires.sort(key=lambda x: x['distance_km'])
+
+        rows = list(csv.DictReader(StringIO(csv_text)))
+
+        # Distances for every detection in one vectorized pass
+        fire_lats = np.array([float(row['latitude']) for row in rows])
+        fire_lons = np.array([float(row['longitude']) for row in rows])
+        distances = FirmsService._calculate_distances(origin_lat, origin_lon, fire_lats, fire_lons)
+
+        # Only include fires within radius, closest first (stable, like list.sort on the rounded km)
+        in_range = np.flatnonzero(distances <= max_radius)
+        distance_km = np.array([round(d, 2) for d in distances[in_range].tolist()])
+        order = in_range[np.argsort(distance_km, kind='stable')]
+        distance_km = np.sort(distance_km, kind='stable')
+
+        # Severity for the whole batch at once
+        kept = [rows[i] for i in order.tolist()]
+        brightness = np.array([float(row.get('bright_ti4', row.get('brightness', 0))) for row in kept])
+        confidence = np.array([float(row.get('confidence', 0)) for row in kept])
+        severity = FirmsService._classify_fire_severity_batch(brightness, confidence)
+
+        fires = [
+            {
+                'latitude': fire_lat,
+                'longitude': fire_lon,
+                'brightness': fire_brightness,
+                'confidence': fire_confidence,
+                'scan': float(row.get('scan', 0)),
+                'track': float(row.get('track', 0)),
+                'acq_date': row.get('acq_date'),
+                'acq_time': row.get('acq_time'),
+                'satellite': row.get('satellite', 'Unknown'),
+                'distance_km': distance,
+                'severity': fire_severity
+            }
+            for row, fire_lat, fire_lon, fire_brightness, fire_confidence, distance, fire_severity in zip(
+                kept,
+                fire_lats[order].tolist(),
+                fire_lons[order].tolist(),
+                brightness.tolist(),
+                confidence.tolist(),
+                distance_km.tolist(),
+                severity.tolist()
+            )
+        ]
 
         return {
             'count': len(fires),
@@ -234,6 +297,8 @@ class FirmsService:
         """
         # Simulate realistic wildfire scenarios based on location
         mock_fires = []
+        now = datetime.utcnow()
+        today = now.strftime('%Y-%m-%d')
 
         # Example: California-like coordinates often have fires
         if 32 <= lat <= 42 and -124 <= lon <= -114:
@@ -256,7 +321,7 @@ class FirmsService:
                     'confidence': 85,
                     'scan': 1.2,
                     'track': 1.1,
-                    'acq_date': datetime.utcnow().strftime('%Y-%m-%d'),
+                    'acq_date': today,
                     'acq_time': '1430',
                     'satellite': 'VIIRS_SNPP',
                     'distance_km': round(fire1_distance, 2),
@@ -269,7 +334,7 @@ class FirmsService:
                     'confidence': 65,
                     'scan': 1.0,
                     'track': 1.0,
-                    'acq_date': datetime.utcnow().strftime('%Y-%m-%d'),
+                    'acq_date': today,
                     'acq_time': '1245',
                     'satellite': 'VIIRS_SNPP',
                     'distance_km': round(fire2_distance, 2),
@@ -285,6 +350,6 @@ class FirmsService:
             'fires': mock_fires,
             'closest_fire': mock_fires[0] if mock_fires else None,
             'search_radius_km': radius_km,
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': now.isoformat() + 'Z',
             'note': 'Mock data with precise coordinates - Configure FIRMS API key for real data'
         }
@@ -11,6 +11,8 @@ from typing import Dict, Optional, Any
 import logging
 import os
 
+from services import AQI_CATEGORIES, aqi_band
+
 # Configure Gemini API
 # Get your own free API key at: https://ai.google.dev/
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")  # Add your key to .env file
@@ -20,7 +22,7 @@ if GEMINI_API_KEY:
 # Initialize the model (using gemini-2.5-flash for better availability)
 model = genai.GenerativeModel('gemini-2.5-flash')
 
-logger = logging.getLogger(__name__)
+logger = logging.getLogger('clearskies.' + __name__)
 
 
 class GeminiService:
@@ -227,93 +229,90 @@ Format your response with clear section headers and bullet points for easy readi
     @staticmethod
     def _get_aqi_category(aqi: int) -> str:
         """Get AQI category from AQI value."""
-        if aqi <= 50:
-            return "Good"
-        elif aqi <= 100:
-            return "Moderate"
-        elif aqi <= 150:
-            return "Unhealthy for Sensitive Groups"
-        elif aqi <= 200:
-            return "Unhealthy"
-        elif aqi <= 300:
-            return "Very Unhealthy"
-        else:
-            return "Hazardous"
-
-    @staticmethod
-    def _get_fallback_insights(aqi: int) -> Dict[str, Any]:
-        """Provide fallback insights when AI service fails."""
-
-        category = GeminiService._get_aqi_category(aqi)
-
-        fallback = {
-            'summary': f"The air quality is currently {category} with an AQI of {aqi}.",
-            'health_recommendations': [],
-            'actionable_tips': []
-        }
-
-        if aqi <= 50:
-            fallback['summary'] += " Air quality is satisfactory, and air pollution poses little or no risk."
-            fallback['health_recommendations'] = [
+        return AQI_CATEGORIES[aqi_band(aqi)]
+
+    # Fallback guidance per AQI band: (summary sentence, health recommendations, actionable tips).
+    # Very Unhealthy and Hazardous share the emergency row.
+    _FALLBACK_GUIDANCE = (
+        (
+            " Air quality is satisfactory, and air pollution poses little or no risk.",
+            (
                 "Enjoy outdoor activities",
                 "No health precautions needed for the general public"
-            ]
-            fallback['actionable_tips'] = [
+            ),
+            (
                 "Great day for outdoor exercise",
                 "Open windows for fresh air"
-            ]
-        elif aqi <= 100:
-            fallback['summary'] += " Air quality is acceptable for most people, though sensitive individuals may experience minor effects."
-            fallback['health_recommendations'] = [
+            )
+        ),
+        (
+            " Air quality is acceptable for most people, though sensitive individuals may experience minor effects.",
+            (
                 "Unusually sensitive people should consider reducing prolonged outdoor exertion",
                 "General public can enjoy normal outdoor activities"
-            ]
-            fallback['actionable_tips'] = [
+            ),
+            (
                 "Monitor symptoms if you're sensitive to air pollution",
                 "Consider indoor activities if you have respiratory conditions"
-            ]
-        elif aqi <= 150:
-            fallback['summary'] += " Members of sensitive groups may experience health effects, but the general public is less likely to be affected."
-            fallback['health_recommendations'] = [
+            )
+        ),
+        (
+            " Members of sensitive groups may experience health effects, but the general public is less likely to be affected.",
+            (
                 "Children, elderly, and people with respiratory conditions should limit prolonged outdoor exertion",
                 "General public should reduce prolonged or heavy outdoor activities",
                 "Consider wearing a mask if you're in a sensitive group"
-            ]
-            fallback['actionable_tips'] = [
+            ),
+            (
                 "Close windows to prevent outdoor air from entering",
                 "Use air purifiers indoors if available",
                 "Reschedule outdoor activities to times with better air quality"
-            ]
-        elif aqi <= 200:
-            fallback['summary'] += " Everyone may begin to experience health effects; members of sensitive groups may experience more serious effects."
-            fallback['health_recommendations'] = [
+            )
+        ),
+        (
+            " Everyone may begin to experience health effects; members of sensitive groups may experience more serious effects.",
+            (
                 "Everyone should avoid prolonged outdoor exertion",
                 "Sensitive groups should avoid all outdoor activities",
                 "Wear N95 masks when going outside",
                 "Stay indoors as much as possible"
-            ]
-            fallback['actionable_tips'] = [
+            ),
+            (
                 "Keep windows and doors closed",
                 "Run air purifiers on high settings",
                 "Limit outdoor exposure to essential activities only",
                 "Check AQI regularly for improvements"
-            ]
-        else:
-            fallback['summary'] += " Health alert: everyone may experience serious health effects. This is an emergency condition."
-            fallback['health_recommendations'] = [
+            )
+        ),
+        (
+            " Health alert: everyone may experience serious health effects. This is an emergency condition.",
+            (
                 "Everyone should avoid all outdoor activities",
                 "Stay indoors with windows closed",
                 "Use air purifiers and N95 masks",
                 "Seek medical attention if experiencing symptoms"
-            ]
-            fallback['actionable_tips'] = [
+            ),
+            (
                 "Remain indoors with air filtration systems running",
                 "Seal windows and doors to prevent outdoor air entry",
                 "Wear N95 masks if you must go outside",
                 "Monitor health closely and contact healthcare providers if needed"
-            ]
+            )
+        )
+    )
 
-        return fallback
+    @staticmethod
+    def _get_fallback_insights(aqi: int) -> Dict[str, Any]:
+        """Provide fallback insights when AI service fails."""
+        band = aqi_band(aqi)
+        summary, recommendations, tips = GeminiService._FALLBACK_GUIDANCE[min(band, 4)]
+
+        # Fresh lists - callers are free to extend them
+        return {
+            'summary': f"The air quality is currently {AQI_CATEGORIES[band]} with an AQI of {aqi}.{summary}",
+            'health_recommendations': list(recommendations),
+            'actionable_tips': list(tips)
+        }
 
 
 class GeminiInsightsGenerator:
@@ -12,11 +12,16 @@ Uses Open-Meteo Geocoding API (free, no key required, NASA-quality data)
 ═══════════════════════════════════════════════════════════════════════════
 """
 
-import requests
+import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import math
 
+from cache import cached, geocode_cache
+from http_session import parse_json, session_for
+
+logger = logging.getLogger('clearskies.' + __name__)
+
 
 class GeocodingService:
     """
@@ -29,6 +34,7 @@ class GeocodingService:
 
     # Nominatim reverse geocoding (OpenStreetMap - free)
     NOMINATIM_API = "https://nominatim.openstreetmap.org/reverse"
+    NOMINATIM_HEADERS = {'User-Agent': 'ClearSkies Air Quality App'}  # Nominatim requires an identifying agent
 
     @staticmethod
     def search_location(query: str, count: int = 10) -> List[Dict[str, Any]]:
@@ -50,9 +56,9 @@ class GeocodingService:
                 'format': 'json'
             }
 
-            response = requests.get(GeocodingService.GEOCODING_API, params=params, timeout=20)
+            response = session_for(GeocodingService.GEOCODING_API).get(GeocodingService.GEOCODING_API, params=params, timeout=20)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             results = data.get('results', [])
             locations = []
@@ -75,7 +81,7 @@ class GeocodingService:
             return locations
 
         except Exception as e:
-            print(f"Geocoding search error: {e}")
+            logger.error(f"Geocoding search error: {e}")
             return []
 
     @staticmethod
@@ -91,29 +97,7 @@ class GeocodingService:
             Detailed location information
         """
         try:
-            # Use Nominatim for detailed reverse geocoding
-            params = {
-                'lat': lat,
-                'lon': lon,
-                'format': 'json',
-                'zoom': 18,  # Building/street level
-                'addressdetails': 1
-            }
-
-            headers = {
-                'User-Agent': 'ClearSkies Air Quality App'
-            }
-
-            response = requests.get(
-                GeocodingService.NOMINATIM_API,
-                params=params,
-                headers=headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            address = data.get('address', {})
+            address = GeocodingService._fetch_address(lat, lon)
 
             # Build precise location name
             location_parts = []
@@ -163,9 +147,37 @@ class GeocodingService:
             }
 
         except Exception as e:
-            print(f"Reverse geocoding error: {e}")
+            logger.error(f"Reverse geocoding error: {e}")
             return GeocodingService._get_fallback_location(lat, lon)
 
+    @staticmethod
+    @cached(geocode_cache)
+    def _fetch_address(lat: float, lon: float) -> Dict[str, Any]:
+        """
+        Nominatim address lookup, cached on the ~100m coordinate grid.
+        Street addresses don't move - repeat lookups skip the rate-limited API.
+        Failures raise and are never cached.
+        """
+        # Use Nominatim for detailed reverse geocoding
+        params = {
+            'lat': lat,
+            'lon': lon,
+            'format': 'json',
+            'zoom': 18,  # Building/street level
+            'addressdetails': 1
+        }
+
+        response = session_for(GeocodingService.NOMINATIM_API).get(
+            GeocodingService.NOMINATIM_API,
+            params=params,
+            headers=GeocodingService.NOMINATIM_HEADERS,
+            timeout=10
+        )
+        response.raise_for_status()
+        data = parse_json(response)
+
+        return data.get('address', {})
+
     @staticmethod
     def _format_display_name(result: Dict) -> str:
         """
@@ -282,8 +294,8 @@ class GeocodingService:
                 'format': 'json'
             }
 
-            response = requests.get(GeocodingService.GEOCODING_API, params=params, timeout=20)
-            data = response.json()
+            response = session_for(GeocodingService.GEOCODING_API).get(GeocodingService.GEOCODING_API, params=params, timeout=20)
+            data = parse_json(response)
 
             results = data.get('results', [])
             nearby = []
@@ -311,5 +323,5 @@ class GeocodingService:
             return nearby[:10]  # Return top 10 closest
 
         except Exception as e:
-            print(f"Nearby cities error: {e}")
+            logger.error(f"Nearby cities error: {e}")
             return []
@@ -0,0 +1,85 @@
+"""
+Pooled HTTP Sessions
+Keep-alive connections for the upstream APIs - one TLS handshake, many requests.
+"""
+import threading
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session(pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a requests session backed by a pooled, retrying HTTPAdapter.
+
+    Transient upstream failures (rate limits, gateway errors) are retried with
+    backoff. The final response is returned rather than raised so callers keep
+    their existing status-code checks.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum connections kept alive per host
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=3,
+        read=0,  # A read timeout already waited the full timeout - don't repeat it
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One pooled session per upstream host, created on first use
+_SESSIONS: Dict[str, requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def session_for(url: str) -> requests.Session:
+    """
+    Shared pooled session for the host that `url` points at.
+
+    Args:
+        url: Any URL on the upstream host
+
+    Returns:
+        The host's requests.Session, built on first use
+    """
+    host = urlsplit(url).netloc
+    session = _SESSIONS.get(host)
+    if session is None:
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.setdefault(host, build_session())
+    return session
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body with orjson.
+
+    Parses the raw bytes directly - faster than response.json(), which decodes
+    to str first and then runs the stdlib parser.
+
+    Args:
+        response: Response whose body is JSON
+
+    Returns:
+        Decoded JSON value
+    """
+    return orjson.loads(response.content)
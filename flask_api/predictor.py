@@ -15,7 +15,6 @@ Scientific Approach:
 
 ═══════════════════════════════════════════════════════════════════════════
 """
-import glob
 import os
 import numpy as np
 import xarray as xr
@@ -25,6 +24,7 @@ from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import PolynomialFeatures
 
 from config import config
+from services import AQI_CATEGORIES, TEMPO_PPB_SCALE, aqi_band, no2_ppb_to_aqi
 import tempo_util
 
 
@@ -50,21 +50,17 @@ class TEMPOPredictor:
         Returns:
             Dictionary with timestamps and NO₂ values, or None if insufficient data
         """
-        # Find all TEMPO NetCDF files
-        pattern = os.path.join(config.TEMPO_DATA_DIR, "*.nc")
-        files = glob.glob(pattern)
+        # All TEMPO NetCDF files, chronological - the directory scan is shared and cached
+        files = tempo_util.list_tempo_files(config.TEMPO_DATA_DIR)
 
         if not files:
             return None
 
-        # Sort by modification time (chronological order)
-        files.sort(key=os.path.getmtime)
-
         # Extract NO₂ values for this location from each file
         timestamps = []
         no2_values = []
 
-        for file_path in files:
+        for file_path, mtime in files:
             try:
                 # Get NO₂ value at this location from this timestep
                 result = tempo_util.get_nearest_value(file_path, lat, lon)
@@ -78,7 +74,7 @@ class TEMPOPredictor:
                 if 'TEMPO' in filename and 'NO2' in filename:
                     # Parse timestamp from filename (simplified)
                     # For synthetic data, use file modification time
-                    file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
+                    file_time = datetime.fromtimestamp(mtime)
                     timestamps.append(file_time)
                     no2_values.append(result['value'])
 
@@ -135,21 +131,22 @@ class TEMPOPredictor:
         model = LinearRegression()
         model.fit(X, y)
 
-        # Predict 24 hours ahead
-        hours_since_start = (timestamps[-1] - t0).total_seconds() / 3600
-        future_hours = hours_since_start + 24
-
-        X_future = np.array([[future_hours]])
+        # Predict 24 hours ahead - scored together with the in-sample fit in one call
+        future_hours = hours_elapsed[-1] + 24
+        fitted = model.predict(np.append(hours_elapsed, future_hours).reshape(-1, 1))
+        y_pred = fitted[:-1]
+        predicted_no2 = float(fitted[-1])
 
-        predicted_no2 = float(model.predict(X_future)[0])
+        # Observed summary statistics, each taken once and shared below
+        y_mean = y.mean()
+        max_observed = y.max()
 
         # Constrain prediction to reasonable bounds
         # NO2 shouldn't exceed 10x the maximum observed value
-        max_observed = np.max(no2_values)
         if predicted_no2 > max_observed * 10:
             predicted_no2 = max_observed * 1.2  # Cap at 20% above max observed
         elif predicted_no2 < 0:
-            predicted_no2 = np.mean(no2_values)  # Floor at mean if negative
+            predicted_no2 = y_mean  # Floor at mean if negative
 
         # Calculate prediction time
         prediction_time = timestamps[-1] + timedelta(hours=24)
@@ -158,9 +155,8 @@ class TEMPOPredictor:
         aqi_info = TEMPOPredictor._calculate_aqi_from_no2(predicted_no2)
 
         # Calculate confidence based on R² score
-        y_pred = model.predict(X)
         ss_res = np.sum((y - y_pred) ** 2)
-        ss_tot = np.sum((y - np.mean(y)) ** 2)
+        ss_tot = np.sum((y - y_mean) ** 2)
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
 
         confidence = "high" if r_squared > 0.7 else "medium" if r_squared > 0.4 else "low"
@@ -193,31 +189,17 @@ class TEMPOPredictor:
         """
         # Convert molecules/cm² to ppb
         # Empirical conversion: 1e15 molecules/cm² ≈ 20 ppb
-        ppb = (no2_molecules_cm2 / 1e15) * 20
-
-        # EPA NO₂ AQI breakpoints (ppb to AQI)
-        breakpoints = [
-            (0, 53, 0, 50),          # Good
-            (54, 100, 51, 100),      # Moderate
-            (101, 360, 101, 150),    # Unhealthy for Sensitive
-            (361, 649, 151, 200),    # Unhealthy
-            (650, 1249, 201, 300),   # Very Unhealthy
-            (1250, 2049, 301, 500),  # Hazardous
-        ]
-
-        # Find matching breakpoint and interpolate AQI
-        for c_low, c_high, aqi_low, aqi_high in breakpoints:
-            if c_low <= ppb <= c_high:
-                aqi = ((aqi_high - aqi_low) / (c_high - c_low)) * (ppb - c_low) + aqi_low
-                category = TEMPOPredictor._get_aqi_category(int(aqi))
-                advice = TEMPOPredictor._get_health_advice(int(aqi))
-
-                return {
-                    'aqi': int(aqi),
-                    'category': category,
-                    'advice': advice,
-                    'ppb': round(ppb, 2)
-                }
+        ppb = no2_molecules_cm2 * TEMPO_PPB_SCALE
+
+        # EPA NO₂ AQI from the shared, precomputed breakpoint curve
+        aqi = no2_ppb_to_aqi(ppb)
+        if aqi is not None:
+            return {
+                'aqi': aqi,
+                'category': TEMPOPredictor._get_aqi_category(aqi),
+                'advice': TEMPOPredictor._get_health_advice(aqi),
+                'ppb': round(ppb, 2)
+            }
 
         # Exceeds all breakpoints
         return {
@@ -227,21 +209,20 @@ class TEMPOPredictor:
             'ppb': round(ppb, 2)
         }
 
+    # Forward-looking advice, one per AQI_CATEGORIES band
+    FORECAST_ADVICE = (
+        'Excellent air quality expected — ideal conditions for outdoor activities tomorrow.',
+        'Moderate air quality expected — outdoor activities safe for everyone tomorrow.',
+        'Limit prolonged outdoor exposure during afternoon hours — sensitive groups should plan accordingly.',
+        'Reduce outdoor activities tomorrow — everyone should limit prolonged exertion.',
+        'Avoid outdoor activities tomorrow — stay indoors when possible.',
+        'Health alert: Remain indoors tomorrow. Air quality extremely dangerous.'
+    )
+
     @staticmethod
     def _get_aqi_category(aqi: int) -> str:
         """Map AQI to EPA category name."""
-        if aqi <= 50:
-            return 'Good'
-        elif aqi <= 100:
-            return 'Moderate'
-        elif aqi <= 150:
-            return 'Unhealthy for Sensitive Groups'
-        elif aqi <= 200:
-            return 'Unhealthy'
-        elif aqi <= 300:
-            return 'Very Unhealthy'
-        else:
-            return 'Hazardous'
+        return AQI_CATEGORIES[aqi_band(aqi)]
 
     @staticmethod
     def _get_health_advice(aqi: int) -> str:
@@ -252,18 +233,7 @@ class TEMPOPredictor:
           - Observation: "Air quality is X"
           - Prediction: "Air quality will be X — plan accordingly"
         """
-        if aqi <= 50:
-            return 'Excellent air quality expected — ideal conditions for outdoor activities tomorrow.'
-        elif aqi <= 100:
-            return 'Moderate air quality expected — outdoor activities safe for everyone tomorrow.'
-        elif aqi <= 150:
-            return 'Limit prolonged outdoor exposure during afternoon hours — sensitive groups should plan accordingly.'
-        elif aqi <= 200:
-            return 'Reduce outdoor activities tomorrow — everyone should limit prolonged exertion.'
-        elif aqi <= 300:
-            return 'Avoid outdoor activities tomorrow — stay indoors when possible.'
-        else:
-            return 'Health alert: Remain indoors tomorrow. Air quality extremely dangerous.'
+        return TEMPOPredictor.FORECAST_ADVICE[aqi_band(aqi)]
 
     @staticmethod
     def generate_forecast(lat: float, lon: float, city: str = None) -> Dict[str, Any]:
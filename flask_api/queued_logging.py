@@ -0,0 +1,51 @@
+"""
+Queued Logging
+Requests hand log records to an in-memory queue; a background thread does the I/O.
+"""
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+
+_log_queue = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+
+
+def start_queued_logging(level: int = logging.INFO, name: str = 'clearskies') -> QueueListener:
+    """
+    Route the app's logger through a QueueHandler and start its listener thread.
+
+    Logging calls on the request path only enqueue the record. The listener
+    thread formats it and writes it to stdout, where the print-based logs used
+    to go. Only the named logger is touched - the root logger and its level are
+    left alone, so third-party libraries log exactly as they did before. Safe
+    to call more than once - the first call wins.
+
+    Args:
+        level: Minimum level for the app's logger
+        name: Name of the app's logger
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter('%(message)s'))
+
+    app_logger = logging.getLogger(name)
+    app_logger.addHandler(QueueHandler(_log_queue))
+    app_logger.setLevel(level)
+    app_logger.propagate = False
+
+    _listener = QueueListener(_log_queue, stream, respect_handler_level=True)
+    _listener.start()
+
+    # Drain whatever is still queued when the process exits
+    atexit.register(_listener.stop)
+    return _listener
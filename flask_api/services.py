@@ -12,19 +12,152 @@ This module orchestrates intelligence from three worlds:
 ═══════════════════════════════════════════════════════════════════════════
 """
 import os
-import requests
+import hashlib
+import logging
+from math import radians, cos, sin, asin, sqrt
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from typing import Optional, Dict, Any
 from datetime import datetime
 from config import config
-from cache import cached, tempo_cache, forecast_cache
+from cache import cached, tempo_cache, forecast_cache, openaq_cache
+from http_session import build_session, parse_json, session_for
 import tempo_util
 
+logger = logging.getLogger('clearskies.' + __name__)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Air Quality Index Calculator - EPA Standard
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Upper bound of each EPA category band (inclusive) - anything above is Hazardous
+AQI_BREAKS = (50, 100, 150, 200, 300)
+AQI_CATEGORIES = (
+    'Good',
+    'Moderate',
+    'Unhealthy for Sensitive Groups',
+    'Unhealthy',
+    'Very Unhealthy',
+    'Hazardous'
+)
+
+
+def aqi_band(aqi: float) -> int:
+    """Index (0-5) of the EPA category band an AQI falls into. NaN reads as Hazardous."""
+    if type(aqi) is int and 0 <= aqi <= 500:
+        return _AQI_BAND_LUT[aqi]
+    # bisect puts NaN in band 0 - a missing reading must never show as Good
+    if aqi != aqi:
+        return len(AQI_BREAKS)
+    return bisect_left(AQI_BREAKS, aqi)
+
+
+# Band of every whole-number AQI on the EPA scale, resolved once at import -
+# WAQI and the calculators hand out plain ints, so most lookups are one index
+_AQI_BAND_LUT = bytes(bisect_left(AQI_BREAKS, aqi) for aqi in range(501))
+
+
+def aqi_category_batch(aqis: np.ndarray) -> np.ndarray:
+    """Vectorized AQI_CATEGORIES lookup - searchsorted 'left' matches aqi_band."""
+    return _AQI_CATEGORY_ARRAY[np.searchsorted(AQI_BREAKS, aqis)]
+
+
+_AQI_CATEGORY_ARRAY = np.array(AQI_CATEGORIES)
+
+# TEMPO column density to surface ppb: 1e15 molecules/cm² ≈ 20 ppb (empirical)
+TEMPO_PPB_SCALE = 20.0 / 1e15
+
+
+# US EPA AQI breakpoints: (C_low, C_high, AQI_low, AQI_high)
+EPA_BREAKPOINTS = {
+    'PM2.5': [
+        (0.0, 12.0, 0, 50),
+        (12.1, 35.4, 51, 100),
+        (35.5, 55.4, 101, 150),
+        (55.5, 150.4, 151, 200),
+        (150.5, 250.4, 201, 300),
+        (250.5, 500.4, 301, 500)
+    ],
+    'PM10': [
+        (0, 54, 0, 50),
+        (55, 154, 51, 100),
+        (155, 254, 101, 150),
+        (255, 354, 151, 200),
+        (355, 424, 201, 300),
+        (425, 604, 301, 500)
+    ],
+    'NO2': [
+        (0, 53, 0, 50),
+        (54, 100, 51, 100),
+        (101, 360, 101, 150),
+        (361, 649, 151, 200),
+        (650, 1249, 201, 300),
+        (1250, 2049, 301, 500)
+    ],
+    'O3': [
+        (0, 54, 0, 50),
+        (55, 70, 51, 100),
+        (71, 85, 101, 150),
+        (86, 105, 151, 200),
+        (106, 200, 201, 300)
+    ],
+    'CO': [
+        (0.0, 4.4, 0, 50),
+        (4.5, 9.4, 51, 100),
+        (9.5, 12.4, 101, 150),
+        (12.5, 15.4, 151, 200),
+        (15.5, 30.4, 201, 300),
+        (30.5, 50.4, 301, 500)
+    ],
+    'SO2': [
+        (0, 35, 0, 50),
+        (36, 75, 51, 100),
+        (76, 185, 101, 150),
+        (186, 304, 151, 200),
+        (305, 604, 201, 300),
+        (605, 1004, 301, 500)
+    ]
+}
+
+
+def _interpolation_curve(breakpoints):
+    """
+    Flatten EPA breakpoint rows into the knot arrays np.interp expects.
+    Each row contributes its (C_low, AQI_low) and (C_high, AQI_high) points,
+    so the EPA formula holds inside a row and the small gaps between rows
+    (e.g. 12.0 -> 12.1) are bridged linearly.
+    """
+    concentrations = np.array([c for c_low, c_high, _, _ in breakpoints for c in (c_low, c_high)], dtype=float)
+    aqi_values = np.array([a for _, _, aqi_low, aqi_high in breakpoints for a in (aqi_low, aqi_high)], dtype=float)
+
+    # Shared across requests and threads - make them read-only
+    concentrations.setflags(write=False)
+    aqi_values.setflags(write=False)
+    return concentrations, aqi_values
+
+
+# Precomputed once at import - calculate_pollutant_aqi is on every request path
+_AQI_CURVES = {name: _interpolation_curve(rows) for name, rows in EPA_BREAKPOINTS.items()}
+
+
+def no2_ppb_to_aqi(ppb: float) -> Optional[int]:
+    """
+    EPA NO2 AQI for a surface concentration in ppb, truncated to an integer.
+    Shared by the satellite calculator and the predictor - both read the same
+    precomputed NO2 curve. Returns None beyond the top of the table, or for NaN.
+
+    Negative values are clamped to 0 ppb (AQI 0). TEMPO tropospheric columns
+    go below zero through retrieval noise over clean air - that is a reading
+    of no NO2, not an off-scale one.
+    """
+    concentrations, aqi_values = _AQI_CURVES['NO2']
+    if not ppb <= concentrations[-1]:
+        return None
+    return int(np.interp(max(ppb, 0.0), concentrations, aqi_values))
+
+
 class AQICalculator:
     """
     Transform raw pollutant measurements into human-readable Air Quality Index.
@@ -32,14 +165,7 @@ class AQICalculator:
     """
 
     # NO2 breakpoints (ppb to AQI) - converted from molecules/cm²
-    NO2_BREAKPOINTS = [
-        (0, 53, 0, 50),          # Good
-        (54, 100, 51, 100),      # Moderate
-        (101, 360, 101, 150),    # Unhealthy for Sensitive
-        (361, 649, 151, 200),    # Unhealthy
-        (650, 1249, 201, 300),   # Very Unhealthy
-        (1250, 2049, 301, 500),  # Hazardous
-    ]
+    NO2_BREAKPOINTS = EPA_BREAKPOINTS['NO2']
 
     @staticmethod
     def molecules_cm2_to_ppb(value: float) -> float:
@@ -55,7 +181,7 @@ class AQICalculator:
         """
         # Simplified conversion: 1e15 molecules/cm² ≈ 20 ppb (empirical)
         # Real conversion requires atmospheric modeling, but this gives useful estimates
-        return (value / 1e15) * 20
+        return value * TEMPO_PPB_SCALE
 
     @staticmethod
     def calculate_aqi(pollutant: str, value: float, unit: str, source: str = None) -> Dict[str, Any]:
@@ -72,28 +198,29 @@ class AQICalculator:
         Returns:
             Dictionary with AQI, category, and health advisory
         """
-        # Handle TEMPO satellite NO2 data
-        # Check if molecules/cm² unit (satellite data) or if source indicates NO2
-        is_no2_data = (
-            ('no2' in pollutant.lower()) or
+        # Handle TEMPO satellite NO2 data - only column densities (molecules/cm²) convert,
+        # so check the unit first and lower-case each string once
+        is_column_density = 'molecules' in unit.lower()
+        pollutant_lower = pollutant.lower()
+        is_no2_data = is_column_density and (
+            ('no2' in pollutant_lower) or
             (source and 'no2' in source.lower()) or
-            ('troposphere' in pollutant.lower() and 'molecules' in unit.lower())  # TEMPO NO2 specific
+            ('troposphere' in pollutant_lower)  # TEMPO NO2 specific
         )
 
-        if is_no2_data and 'molecules' in unit.lower():
+        if is_no2_data:
             ppb = AQICalculator.molecules_cm2_to_ppb(value)
 
-            # Find appropriate AQI breakpoint
-            for c_low, c_high, aqi_low, aqi_high in AQICalculator.NO2_BREAKPOINTS:
-                if c_low <= ppb <= c_high:
-                    # Linear interpolation within breakpoint range
-                    aqi = ((aqi_high - aqi_low) / (c_high - c_low)) * (ppb - c_low) + aqi_low
-                    return {
-                        'aqi': int(aqi),
-                        'category': AQICalculator._get_category(int(aqi)),
-                        'pollutant_ppb': round(ppb, 2),
-                        'advisory': AQICalculator._get_advisory(int(aqi))
-                    }
+            # Linear interpolation along the precomputed NO2 breakpoint curve
+            aqi = no2_ppb_to_aqi(ppb)
+            if aqi is not None:
+                band = aqi_band(aqi)
+                return {
+                    'aqi': aqi,
+                    'category': AQI_CATEGORIES[band],
+                    'pollutant_ppb': round(ppb, 2),
+                    'advisory': AQICalculator.ADVISORIES[band]
+                }
 
             # Exceeds all breakpoints - hazardous
             return {
@@ -110,21 +237,20 @@ class AQICalculator:
             'advisory': 'Insufficient data for AQI calculation'
         }
 
+    # Health advisories, one per AQI_CATEGORIES band
+    ADVISORIES = (
+        'Air quality excellent — ideal conditions for outdoor activity',
+        'Air quality acceptable — outdoor activity safe for everyone',
+        'Air quality moderate — sensitive groups should limit prolonged outdoor exertion',
+        'Air quality unhealthy — everyone should reduce prolonged outdoor exertion',
+        'Air quality very unhealthy — avoid outdoor activity',
+        'Health alert: everyone may experience serious health effects — remain indoors'
+    )
+
     @staticmethod
     def _get_category(aqi: int) -> str:
         """Map AQI number to category name."""
-        if aqi <= 50:
-            return 'Good'
-        elif aqi <= 100:
-            return 'Moderate'
-        elif aqi <= 150:
-            return 'Unhealthy for Sensitive Groups'
-        elif aqi <= 200:
-            return 'Unhealthy'
-        elif aqi <= 300:
-            return 'Very Unhealthy'
-        else:
-            return 'Hazardous'
+        return AQI_CATEGORIES[aqi_band(aqi)]
 
     @staticmethod
     def _get_advisory(aqi: int) -> str:
@@ -132,18 +258,7 @@ class AQICalculator:
         Generate human-readable health advisory.
         This is where data becomes wisdom.
         """
-        if aqi <= 50:
-            return 'Air quality excellent — ideal conditions for outdoor activity'
-        elif aqi <= 100:
-            return 'Air quality acceptable — outdoor activity safe for everyone'
-        elif aqi <= 150:
-            return 'Air quality moderate — sensitive groups should limit prolonged outdoor exertion'
-        elif aqi <= 200:
-            return 'Air quality unhealthy — everyone should reduce prolonged outdoor exertion'
-        elif aqi <= 300:
-            return 'Air quality very unhealthy — avoid outdoor activity'
-        else:
-            return 'Health alert: everyone may experience serious health effects — remain indoors'
+        return AQICalculator.ADVISORIES[aqi_band(aqi)]
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -193,6 +308,9 @@ class WAQIService:
     WAQI_API_TOKEN = os.getenv("WAQI_API_TOKEN", "demo")  # Replace "demo" with your token
     WAQI_API_BASE = "https://api.waqi.info"
 
+    # Simulated time-of-day multiplier, indexed by UTC hour (0.8 at midnight rising to ~1.2)
+    HOUR_FACTORS = tuple(0.8 + (hour / 24) * 0.4 for hour in range(24))
+
     @staticmethod
     def get_real_time_aqi(lat: float, lon: float) -> Dict[str, Any]:
         """
@@ -206,12 +324,12 @@ class WAQIService:
             url = f"{WAQIService.WAQI_API_BASE}/feed/geo:{lat};{lon}/"
             params = {'token': WAQIService.WAQI_API_TOKEN}
 
-            response = requests.get(url, params=params, timeout=10)
+            response = session_for(url).get(url, params=params, timeout=10)
 
             if response.status_code != 200:
                 return WAQIService._generate_simulated_aqi(lat, lon)
 
-            data = response.json()
+            data = parse_json(response)
 
             if data.get('status') != 'ok':
                 return WAQIService._generate_simulated_aqi(lat, lon)
@@ -231,8 +349,8 @@ class WAQIService:
                 # If coordinates are more than 50km off, this is wrong data (likely demo token)
                 distance = ((lat - station_lat)**2 + (lon - station_lon)**2)**0.5 * 111  # rough km
                 if distance > 50:
-                    print(f"⚠️  WAQI Demo Token Detected: Requested ({lat:.2f}, {lon:.2f}) but got {station_data.get('city', {}).get('name', 'Unknown')} at ({station_lat:.2f}, {station_lon:.2f})")
-                    print(f"    Get a free WAQI token at: https://aqicn.org/data-platform/token/")
+                    logger.warning(f"⚠️  WAQI Demo Token Detected: Requested ({lat:.2f}, {lon:.2f}) but got {station_data.get('city', {}).get('name', 'Unknown')} at ({station_lat:.2f}, {station_lon:.2f})")
+                    logger.warning(f"    Get a free WAQI token at: https://aqicn.org/data-platform/token/")
                     return WAQIService._generate_simulated_aqi(lat, lon)
 
             # Get individual pollutants
@@ -263,7 +381,7 @@ class WAQIService:
             }
 
         except Exception as e:
-            print(f"WAQI API Error: {str(e)}")
+            logger.error(f"WAQI API Error: {str(e)}")
             return WAQIService._generate_simulated_aqi(lat, lon)
 
     @staticmethod
@@ -272,8 +390,6 @@ class WAQIService:
         Generate location-appropriate simulated AQI when real data unavailable.
         Uses geographic heuristics to provide realistic estimates.
         """
-        import hashlib
-        from datetime import datetime
 
         # Use location to generate consistent but varied AQI
         # Major polluted cities will get higher AQI, clean areas lower
@@ -311,8 +427,8 @@ class WAQIService:
             city_type = "location"
 
         # Add time-based variation (pollution varies by time of day)
-        hour_factor = (datetime.utcnow().hour % 24) / 24
-        aqi = int(aqi_base * (0.8 + hour_factor * 0.4))  # ±20% daily variation
+        now = datetime.utcnow()
+        aqi = int(aqi_base * WAQIService.HOUR_FACTORS[now.hour])  # ±20% daily variation
 
         # Ensure reasonable bounds
         aqi = max(15, min(350, aqi))
@@ -332,31 +448,30 @@ class WAQIService:
                 'coordinates': [lat, lon],
                 'url': 'https://aqicn.org/data-platform/token/'
             },
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': now.isoformat() + 'Z',
             'source': 'Simulated (WAQI token required for real data)'
         }
 
     @staticmethod
     def _get_aqi_category(aqi: int) -> str:
         """Get AQI category from numeric value"""
-        if aqi <= 50:
-            return 'Good'
-        elif aqi <= 100:
-            return 'Moderate'
-        elif aqi <= 150:
-            return 'Unhealthy for Sensitive Groups'
-        elif aqi <= 200:
-            return 'Unhealthy'
-        elif aqi <= 300:
-            return 'Very Unhealthy'
-        else:
-            return 'Hazardous'
+        return AQI_CATEGORIES[aqi_band(aqi)]
 
 
 class OpenAQService:
     """OpenAQ - Truth from the ground, measured where we breathe."""
 
+    # Quality labels, one per AQI_CATEGORIES band
+    QUALITY_LEVELS = ('good', 'moderate', 'unhealthy_sensitive', 'unhealthy', 'very_unhealthy', 'hazardous')
+
+    # Keep-alive pool - each dashboard request fans out to many OpenAQ calls
+    _session = build_session()
+
+    # Per-location fan-out - its own pool, so route-level fan-out never waits on itself
+    _executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="openaq")
+
     @staticmethod
+    @cached(openaq_cache)
     def get_measurements(lat: float, lon: float, radius_km: float = 25) -> Dict[str, Any]:
         """
         Gather ground-based measurements from nearby sensors using OpenAQ v3 API.
@@ -382,83 +497,108 @@ class OpenAQService:
                 'X-API-Key': config.OPENAQ_API_KEY
             }
 
-            locations_response = requests.get(locations_url, params=params, headers=headers, timeout=10)
+            locations_response = OpenAQService._session.get(locations_url, params=params, headers=headers, timeout=10)
 
             if locations_response.status_code != 200:
                 return None
 
-            locations_data = locations_response.json()
+            locations_data = parse_json(locations_response)
             locations = locations_data.get('results', [])
 
             if not locations:
                 return None
 
             # Step 2: Collect measurements from all nearby locations
-            aggregated = {}
-            sensor_cache = {}  # Cache sensor metadata to reduce API calls
-
-            for location in locations:
-                location_id = location.get('id')
+            # Flat (parameter, value) columns, reduced per parameter in one NumPy pass below
+            param_keys = []
+            param_values = []
+            param_meta = {}  # parameter -> (unit, display_name), first seen wins
+
+            # Sensor metadata already comes with each location - map it up front in one pass,
+            # read-only while the workers run. /sensors/{id} is only asked for sensors missing here.
+            sensor_cache = {
+                sensor['id']: sensor
+                for location in locations
+                for sensor in location.get('sensors', [])
+                if sensor.get('id') and sensor.get('parameter', {}).get('name')
+            }
 
+            def fetch_latest(location):
                 # Get latest measurements for this location
-                latest_url = f"{config.OPENAQ_API}/locations/{location_id}/latest"
-                latest_response = requests.get(latest_url, headers=headers, timeout=10)
-
-                if latest_response.status_code == 200:
-                    latest_data = latest_response.json()
-                    measurements = latest_data.get('results', [])
-
-                    for measurement in measurements:
-                        sensor_id = measurement.get('sensorsId')
-                        value = measurement.get('value')
-
-                        if sensor_id and value is not None:
-                            # Get or fetch sensor metadata
-                            if sensor_id not in sensor_cache:
-                                sensor_url = f"{config.OPENAQ_API}/sensors/{sensor_id}"
-                                sensor_response = requests.get(sensor_url, headers=headers, timeout=10)
-
-                                if sensor_response.status_code == 200:
-                                    sensor_data = sensor_response.json()
-                                    sensor_results = sensor_data.get('results', [])
-                                    if sensor_results:
-                                        sensor_cache[sensor_id] = sensor_results[0]
-                                else:
-                                    continue
-
-                            sensor_info = sensor_cache.get(sensor_id)
-                            if sensor_info:
-                                param_info = sensor_info.get('parameter', {})
-                                param_name = param_info.get('name', '').lower()
-                                param_unit = param_info.get('units', '')
-
-                                if param_name:
-                                    # Normalize parameter name
-                                    param_normalized = param_name.replace('.', '').replace('_', '')
-
-                                    if param_normalized not in aggregated:
-                                        aggregated[param_normalized] = {'values': [], 'unit': param_unit, 'display_name': param_info.get('displayName', param_name.upper())}
-                                    aggregated[param_normalized]['values'].append(value)
-
-            # Step 3: Calculate averages and format output
+                latest_url = f"{config.OPENAQ_API}/locations/{location.get('id')}/latest"
+                latest_response = OpenAQService._session.get(latest_url, headers=headers, timeout=10)
+
+                if latest_response.status_code != 200:
+                    return []
+                return parse_json(latest_response).get('results', [])
+
+            # The per-location calls are independent - fetch them side by side
+            for measurements in OpenAQService._executor.map(fetch_latest, locations):
+                for measurement in measurements:
+                    sensor_id = measurement.get('sensorsId')
+                    value = measurement.get('value')
+
+                    if sensor_id and value is not None:
+                        # Get or fetch sensor metadata
+                        if sensor_id not in sensor_cache:
+                            sensor_url = f"{config.OPENAQ_API}/sensors/{sensor_id}"
+                            sensor_response = OpenAQService._session.get(sensor_url, headers=headers, timeout=10)
+
+                            if sensor_response.status_code == 200:
+                                sensor_data = parse_json(sensor_response)
+                                sensor_results = sensor_data.get('results', [])
+                                if sensor_results:
+                                    sensor_cache[sensor_id] = sensor_results[0]
+                            else:
+                                continue
+
+                        sensor_info = sensor_cache.get(sensor_id)
+                        if sensor_info:
+                            param_info = sensor_info.get('parameter', {})
+                            param_name = param_info.get('name', '').lower()
+                            param_unit = param_info.get('units', '')
+
+                            if param_name:
+                                # Normalize parameter name
+                                param_normalized = param_name.replace('.', '').replace('_', '')
+
+                                if param_normalized not in param_meta:
+                                    param_meta[param_normalized] = (param_unit, param_info.get('displayName', param_name.upper()))
+                                param_keys.append(param_normalized)
+                                param_values.append(value)
+
+            if not param_keys:
+                return None
+
+            # Step 3: Calculate averages - group by parameter with unique + weighted bincount
+            params, inverse = np.unique(np.array(param_keys), return_inverse=True)
+            counts = np.bincount(inverse)
+            means = np.bincount(inverse, weights=np.asarray(param_values, dtype=float)) / counts
+            index = {param: i for i, param in enumerate(params.tolist())}
+
             averaged = {}
-            for param, data in aggregated.items():
-                # Use display name from API
-                standard_name = data['display_name']
+            for param, (unit, standard_name) in param_meta.items():
+                # standard_name is the display name from the API
+                i = index[param]
+                count = int(counts[i])
+                mean_value = round(float(means[i]), 2)
+
+                # AQI computed once here and only used for the quality level
+                pollutant_aqi = OpenAQService.calculate_pollutant_aqi(standard_name, mean_value)
 
                 averaged[standard_name] = {
-                    'value': round(np.mean(data['values']), 2),
-                    'unit': data['unit'],
+                    'value': mean_value,
+                    'unit': unit,
                     'source': 'OpenAQ Ground Stations',
-                    'sample_count': len(data['values']),
-                    'quality': OpenAQService._assess_pollutant_quality(standard_name, round(np.mean(data['values']), 2))
+                    'sample_count': count,
+                    'quality': OpenAQService._quality_from_aqi(pollutant_aqi)
                 }
 
             return averaged if averaged else None
 
         except Exception as e:
             # Log error for debugging but return None to maintain API consistency
-            print(f"OpenAQ API Error: {str(e)}")
+            logger.error(f"OpenAQ API Error: {str(e)}")
             return None
 
     @staticmethod
@@ -471,102 +611,30 @@ class OpenAQService:
             value: Concentration value in standard units
 
         Returns:
-            AQI value (0-500+)
+            AQI value (0-500+). Negative readings (sensor noise around zero)
+            count as 0 and score AQI 0; a NaN reading scores 500, as an
+            off-scale value does.
         """
-        # US EPA AQI breakpoints: (C_low, C_high, AQI_low, AQI_high)
-        breakpoints = {
-            'PM2.5': [
-                (0.0, 12.0, 0, 50),
-                (12.1, 35.4, 51, 100),
-                (35.5, 55.4, 101, 150),
-                (55.5, 150.4, 151, 200),
-                (150.5, 250.4, 201, 300),
-                (250.5, 500.4, 301, 500)
-            ],
-            'PM10': [
-                (0, 54, 0, 50),
-                (55, 154, 51, 100),
-                (155, 254, 101, 150),
-                (255, 354, 151, 200),
-                (355, 424, 201, 300),
-                (425, 604, 301, 500)
-            ],
-            'NO2': [
-                (0, 53, 0, 50),
-                (54, 100, 51, 100),
-                (101, 360, 101, 150),
-                (361, 649, 151, 200),
-                (650, 1249, 201, 300),
-                (1250, 2049, 301, 500)
-            ],
-            'O3': [
-                (0, 54, 0, 50),
-                (55, 70, 51, 100),
-                (71, 85, 101, 150),
-                (86, 105, 151, 200),
-                (106, 200, 201, 300)
-            ],
-            'CO': [
-                (0.0, 4.4, 0, 50),
-                (4.5, 9.4, 51, 100),
-                (9.5, 12.4, 101, 150),
-                (12.5, 15.4, 151, 200),
-                (15.5, 30.4, 201, 300),
-                (30.5, 50.4, 301, 500)
-            ],
-            'SO2': [
-                (0, 35, 0, 50),
-                (36, 75, 51, 100),
-                (76, 185, 101, 150),
-                (186, 304, 151, 200),
-                (305, 604, 201, 300),
-                (605, 1004, 301, 500)
-            ]
-        }
-
-        if pollutant not in breakpoints:
+        curve = _AQI_CURVES.get(pollutant)
+        if curve is None:
             return None
 
-        # Find the appropriate breakpoint
-        for c_low, c_high, aqi_low, aqi_high in breakpoints[pollutant]:
-            if c_low <= value <= c_high:
-                # Linear interpolation: AQI = ((AQI_high - AQI_low) / (C_high - C_low)) * (C - C_low) + AQI_low
-                aqi = ((aqi_high - aqi_low) / (c_high - c_low)) * (value - c_low) + aqi_low
-                return int(round(aqi))
+        # A non-finite reading cannot be placed on the curve - report it at the top
+        if not np.isfinite(value):
+            return 500
 
-        # If exceeds all breakpoints, return hazardous
-        return 500
+        # Linear interpolation between breakpoints; beyond the table is hazardous
+        concentrations, aqi_values = curve
+        aqi = np.interp(max(value, 0.0), concentrations, aqi_values, right=500)
+        return int(round(float(aqi)))
 
     @staticmethod
-    def _assess_pollutant_quality(pollutant: str, value: float) -> str:
-        """
-        Assess air quality based on pollutant concentration.
-
-        Args:
-            pollutant: Pollutant name (PM2.5, PM10, NO2, CO, SO2, O3)
-            value: Concentration value
-
-        Returns:
-            Quality assessment: 'good', 'moderate', 'unhealthy', 'very_unhealthy', 'hazardous'
-        """
-        # Calculate AQI and map to category
-        aqi = OpenAQService.calculate_pollutant_aqi(pollutant, value)
-
+    def _quality_from_aqi(aqi: Optional[int]) -> str:
+        """Map an already-computed pollutant AQI to its quality level."""
         if aqi is None:
             return 'unknown'
 
-        if aqi <= 50:
-            return 'good'
-        elif aqi <= 100:
-            return 'moderate'
-        elif aqi <= 150:
-            return 'unhealthy_sensitive'
-        elif aqi <= 200:
-            return 'unhealthy'
-        elif aqi <= 300:
-            return 'very_unhealthy'
-        else:
-            return 'hazardous'
+        return OpenAQService.QUALITY_LEVELS[aqi_band(aqi)]
 
 
 class NOAAWeatherService:
@@ -581,17 +649,17 @@ class NOAAWeatherService:
         try:
             # Get NOAA grid point
             points_url = f"{config.NOAA_WEATHER_API}/points/{lat},{lon}"
-            points_response = requests.get(points_url, timeout=10)
+            points_response = session_for(points_url).get(points_url, timeout=10)
 
             if points_response.status_code != 200:
                 return None
 
-            points_data = points_response.json()
+            points_data = parse_json(points_response)
             forecast_url = points_data['properties']['forecast']
 
             # Get current forecast
-            forecast_response = requests.get(forecast_url, timeout=10)
-            forecast_data = forecast_response.json()
+            forecast_response = session_for(forecast_url).get(forecast_url, timeout=10)
+            forecast_data = parse_json(forecast_response)
 
             current = forecast_data['properties']['periods'][0]
 
@@ -623,6 +691,19 @@ class FIRMSService:
     FIRMS_API_BASE = "https://firms.modaps.eosdis.nasa.gov/api/area/csv"
     FIRMS_MAP_KEY = os.getenv("FIRMS_MAP_KEY", "")
 
+    # VIIRS confidence labels as numbers, for averaging
+    CONFIDENCE_SCORES = {'low': 1, 'nominal': 2, 'high': 3}
+
+    @staticmethod
+    def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+        """Calculate distance between two points in km"""
+        R = 6371  # Earth radius in km
+        dlat = radians(lat2 - lat1)
+        dlon = radians(lon2 - lon1)
+        a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
+        c = 2 * asin(sqrt(a))
+        return R * c
+
     @staticmethod
     def get_nearby_wildfires(lat: float, lon: float, radius_km: int = 100, days: int = 1) -> Dict[str, Any]:
         """
@@ -646,7 +727,7 @@ class FIRMSService:
             Dictionary with wildfire detections and statistics
         """
         if not FIRMSService.FIRMS_MAP_KEY:
-            print("FIRMS API Key not configured")
+            logger.warning("FIRMS API Key not configured")
             return None
 
         try:
@@ -656,10 +737,10 @@ class FIRMSService:
             # Build URL: https://firms.modaps.eosdis.nasa.gov/api/area/csv/{MAP_KEY}/{source}/{radius}/{lat},{lon}/{days}
             url = f"{FIRMSService.FIRMS_API_BASE}/{FIRMSService.FIRMS_MAP_KEY}/{source}/{radius_km}/{lat},{lon}/{days}"
 
-            response = requests.get(url, timeout=15)
+            response = session_for(url).get(url, timeout=15)
 
             if response.status_code != 200:
-                print(f"FIRMS API error: {response.status_code}")
+                logger.error(f"FIRMS API error: {response.status_code}")
                 return None
 
             # Parse CSV response
@@ -708,18 +789,7 @@ class FIRMSService:
                 acq_time = fire_data.get('acq_time', '')
 
                 # Calculate distance from center point
-                from math import radians, cos, sin, asin, sqrt
-
-                def haversine(lat1, lon1, lat2, lon2):
-                    """Calculate distance between two points in km"""
-                    R = 6371  # Earth radius in km
-                    dlat = radians(lat2 - lat1)
-                    dlon = radians(lon2 - lon1)
-                    a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
-                    c = 2 * asin(sqrt(a))
-                    return R * c
-
-                distance_km = haversine(lat, lon, fire_lat, fire_lon)
+                distance_km = FIRMSService._haversine(lat, lon, fire_lat, fire_lon)
 
                 fire = {
                     'latitude': fire_lat,
@@ -742,8 +812,7 @@ class FIRMSService:
                 max_frp = max(max_frp, frp)
 
                 # Convert confidence to numeric for averaging
-                confidence_map = {'low': 1, 'nominal': 2, 'high': 3}
-                total_confidence += confidence_map.get(confidence.lower(), 2)
+                total_confidence += FIRMSService.CONFIDENCE_SCORES.get(confidence.lower(), 2)
 
             # Sort by distance (closest first)
             fires.sort(key=lambda x: x['distance_km'])
@@ -767,7 +836,7 @@ class FIRMSService:
             }
 
         except Exception as e:
-            print(f"FIRMS API Error: {str(e)}")
+            logger.error(f"FIRMS API Error: {str(e)}")
             return None
 
 
@@ -783,6 +852,16 @@ class UnifiedForecastService:
     We take complex, disparate data and make it beautifully simple.
     """
 
+    # Ground-driven advisories, one per AQI_CATEGORIES band
+    COMPOSITE_ADVISORIES = (
+        'Air quality excellent — ideal conditions for outdoor activity',
+        'Air quality acceptable — outdoor activity safe for everyone (driven by {pollutant})',
+        'Air quality moderate — sensitive groups should limit prolonged outdoor exertion (high {pollutant})',
+        'Air quality unhealthy — everyone should reduce prolonged outdoor exertion (high {pollutant})',
+        'Air quality very unhealthy — avoid outdoor activity (dangerous {pollutant} levels)',
+        'Health alert: everyone may experience serious health effects — remain indoors (hazardous {pollutant} levels)'
+    )
+
     @staticmethod
     @cached(forecast_cache)
     def get_forecast(lat: float, lon: float) -> Dict[str, Any]:
@@ -819,10 +898,12 @@ class UnifiedForecastService:
 
         # Process satellite data and calculate AQI
         if satellite:
+            no2_value = satellite['value']
+            no2_unit = satellite['unit']
             aqi_data = AQICalculator.calculate_aqi(
                 satellite['pollutant'],
-                satellite['value'],
-                satellite['unit'],
+                no2_value,
+                no2_unit,
                 source=satellite.get('source', '')
             )
 
@@ -831,22 +912,22 @@ class UnifiedForecastService:
 
             # Add NO2 to pollutants
             forecast['pollutants']['NO2'] = {
-                'value': satellite['value'],
-                'unit': satellite['unit'],
+                'value': no2_value,
+                'unit': no2_unit,
                 'ppb': aqi_data.get('pollutant_ppb'),
                 'source': 'satellite'
             }
 
         # Merge ground station data and calculate composite AQI
-        pollutant_aqis = []  # Track all pollutant AQIs to find the worst (dominant pollutant)
+        pollutant_aqis = {}  # pollutant -> AQI, recorded once to find the worst (dominant pollutant)
 
         if ground:
             for pollutant, data in ground.items():
                 # Normalize pollutant names
                 clean_name = pollutant.upper().replace('.', '')
 
-                # Calculate AQI for this pollutant
-                pollutant_aqi = OpenAQService.calculate_pollutant_aqi(clean_name, data['value'])
+                # Calculate AQI for this pollutant - keyed by the display name the curves use
+                pollutant_aqi = OpenAQService.calculate_pollutant_aqi(pollutant, data['value'])
 
                 forecast['pollutants'][clean_name] = {
                     'value': data['value'],
@@ -856,36 +937,22 @@ class UnifiedForecastService:
                 }
 
                 if pollutant_aqi is not None:
-                    pollutant_aqis.append({
-                        'pollutant': clean_name,
-                        'aqi': pollutant_aqi,
-                        'value': data['value']
-                    })
+                    pollutant_aqis[clean_name] = pollutant_aqi
 
         # Use the WORST pollutant AQI as the overall AQI (EPA standard)
         # This ensures we show the most concerning pollutant
         if pollutant_aqis:
-            worst_pollutant = max(pollutant_aqis, key=lambda x: x['aqi'])
+            worst_pollutant = max(pollutant_aqis, key=pollutant_aqis.get)
+            worst_aqi = pollutant_aqis[worst_pollutant]
 
             # Only override satellite AQI if ground data shows worse conditions
-            if forecast['air_quality_index'] is None or worst_pollutant['aqi'] > forecast['air_quality_index']:
-                forecast['air_quality_index'] = worst_pollutant['aqi']
-                forecast['dominant_pollutant'] = worst_pollutant['pollutant']
+            if forecast['air_quality_index'] is None or worst_aqi > forecast['air_quality_index']:
+                forecast['air_quality_index'] = worst_aqi
+                forecast['dominant_pollutant'] = worst_pollutant
 
                 # Update advisory based on composite AQI
-                aqi_val = worst_pollutant['aqi']
-                if aqi_val <= 50:
-                    forecast['advisory'] = 'Air quality excellent — ideal conditions for outdoor activity'
-                elif aqi_val <= 100:
-                    forecast['advisory'] = f'Air quality acceptable — outdoor activity safe for everyone (driven by {worst_pollutant["pollutant"]})'
-                elif aqi_val <= 150:
-                    forecast['advisory'] = f'Air quality moderate — sensitive groups should limit prolonged outdoor exertion (high {worst_pollutant["pollutant"]})'
-                elif aqi_val <= 200:
-                    forecast['advisory'] = f'Air quality unhealthy — everyone should reduce prolonged outdoor exertion (high {worst_pollutant["pollutant"]})'
-                elif aqi_val <= 300:
-                    forecast['advisory'] = f'Air quality very unhealthy — avoid outdoor activity (dangerous {worst_pollutant["pollutant"]} levels)'
-                else:
-                    forecast['advisory'] = f'Health alert: everyone may experience serious health effects — remain indoors (hazardous {worst_pollutant["pollutant"]} levels)'
+                template = UnifiedForecastService.COMPOSITE_ADVISORIES[aqi_band(worst_aqi)]
+                forecast['advisory'] = template.format(pollutant=worst_pollutant)
 
         # Add weather context
         if weather:
@@ -3,8 +3,31 @@ Helper module for reading NASA TEMPO NetCDF files and extracting pollutant value
 """
 import os
 import glob
+import threading
+from collections import OrderedDict
 import xarray as xr
 import numpy as np
+from cachetools import TTLCache, cached
+
+
+@cached(TTLCache(maxsize=8, ttl=60), lock=threading.Lock())
+def list_tempo_files(data_dir="../data/raw/tempo"):
+    """
+    List the TEMPO NetCDF files in a directory with their modification times.
+    The scan is shared process-wide and cached for a minute - new granules arrive hourly at most.
+
+    Args:
+        data_dir: Path to directory containing TEMPO NetCDF files
+
+    Returns:
+        Tuple of (path, mtime) pairs, oldest first
+    """
+    pattern = os.path.join(data_dir, "*.nc")
+    files = [(path, os.path.getmtime(path)) for path in glob.glob(pattern)]
+
+    # Sort by modification time, chronological order
+    files.sort(key=lambda item: item[1])
+    return tuple(files)
 
 
 def get_most_recent_tempo_file(data_dir="../data/raw/tempo"):
@@ -17,15 +40,12 @@ def get_most_recent_tempo_file(data_dir="../data/raw/tempo"):
     Returns:
         Path to most recent file, or None if no files found
     """
-    pattern = os.path.join(data_dir, "*.nc")
-    files = glob.glob(pattern)
+    files = list_tempo_files(data_dir)
 
     if not files:
         return None
 
-    # Sort by modification time, most recent first
-    files.sort(key=os.path.getmtime, reverse=True)
-    return files[0]
+    return files[-1][0]
 
 
 def auto_detect_pollutant_variable(ds):
@@ -81,9 +101,182 @@ def normalize_longitude(lon):
     return lon
 
 
+# Open TEMPO grids, least recently used first - opening a granule and
+# re-detecting its variable and axes used to happen on every uncached lookup
+_MAX_OPEN_GRIDS = 4
+_open_grids = OrderedDict()
+_open_grids_lock = threading.Lock()
+
+
+def _load_grid(file_path):
+    """
+    Open a TEMPO file and resolve everything lookups need from it, once.
+
+    Args:
+        file_path: Path to TEMPO NetCDF file
+
+    Returns:
+        dict with the open dataset, pollutant variable, unit, lat/lon dimension
+        names and coordinate arrays - or with an 'error' message instead
+    """
+    # Open dataset with h5netcdf engine
+    ds = xr.open_dataset(file_path, engine='h5netcdf')
+
+    # Auto-detect pollutant variable
+    var_name, var = auto_detect_pollutant_variable(ds)
+
+    if var_name is None:
+        ds.close()
+        return {'error': 'Could not detect pollutant variable in dataset'}
+
+    # Get unit if available
+    unit = var.attrs.get('units', var.attrs.get('unit', 'unknown'))
+
+    # Detect latitude and longitude dimension names
+    lat_dims = [d for d in var.dims if 'lat' in d.lower()]
+    lon_dims = [d for d in var.dims if 'lon' in d.lower()]
+
+    if not lat_dims or not lon_dims:
+        ds.close()
+        return {
+            'variable_name': var_name,
+            'unit': unit,
+            'error': f'Could not find lat/lon dimensions in variable {var_name}'
+        }
+
+    lat_dim = lat_dims[0]
+    lon_dim = lon_dims[0]
+
+    # Get lat/lon coordinate arrays
+    lons = ds[lon_dim].values
+
+    return {
+        'dataset': ds,
+        'variable_name': var_name,
+        'variable': var,
+        'unit': unit,
+        'lat_dim': lat_dim,
+        'lon_dim': lon_dim,
+        'lats': ds[lat_dim].values,
+        'lons': lons,
+        # Longitudes stored as 0-360 need the query shifted to match
+        'lons_0_360': lons.max() > 180,
+        # If 3D, lookups take the first time/level slice
+        'other_dims': [d for d in var.dims if d not in [lat_dim, lon_dim]]
+    }
+
+
+def _get_grid(file_path):
+    """
+    Grid for a TEMPO file from the open-handle cache, loading it on a miss.
+    Keeps the most recent _MAX_OPEN_GRIDS files open; older handles are closed.
+    Caller must hold _open_grids_lock for as long as it reads from the grid,
+    otherwise another lookup can evict and close it mid-read.
+    """
+    grid = _open_grids.get(file_path)
+    if grid is not None:
+        _open_grids.move_to_end(file_path)
+        return grid
+
+    grid = _load_grid(file_path)
+    _open_grids[file_path] = grid
+
+    while len(_open_grids) > _MAX_OPEN_GRIDS:
+        _, evicted = _open_grids.popitem(last=False)
+        if 'dataset' in evicted:
+            evicted['dataset'].close()
+
+    return grid
+
+
+def preload_grid(file_path):
+    """
+    Open a TEMPO file into the handle cache ahead of the first lookup.
+    Meant for startup - failures are left for the real lookup to report.
+
+    Args:
+        file_path: Path to TEMPO NetCDF file
+    """
+    try:
+        with _open_grids_lock:
+            _get_grid(file_path)
+    except Exception:
+        pass
+
+
+class _LookupError(Exception):
+    """A failed nearest-value lookup, carrying whatever grid metadata was resolved."""
+
+    def __init__(self, message, fields=None):
+        super().__init__(message)
+        self.fields = fields or {}
+
+
+@cached(TTLCache(maxsize=4096, ttl=3600), lock=threading.Lock())
+def _read_nearest(file_path, lat, lon):
+    """
+    Read the grid point nearest to (lat, lon) from a TEMPO file.
+    Only successful reads are cached - failures raise, so a transient error
+    is retried on the next lookup instead of sticking for the hour.
+
+    Returns:
+        dict with variable_name, unit, nearest_lat, nearest_lon and value
+    """
+    fields = {}
+
+    # Hold the lock through the read so the handle cannot be closed under us
+    with _open_grids_lock:
+        grid = _get_grid(file_path)
+
+        if 'variable_name' in grid:
+            fields['variable_name'] = grid['variable_name']
+            fields['unit'] = grid['unit']
+
+        if 'error' in grid:
+            raise _LookupError(grid['error'], fields)
+
+        try:
+            lats = grid['lats']
+            lons = grid['lons']
+            lat_dim = grid['lat_dim']
+            lon_dim = grid['lon_dim']
+
+            # Handle longitude coordinate system (normalize if needed)
+            query_lon_normalized = normalize_longitude(lon)
+            if grid['lons_0_360'] and query_lon_normalized < 0:
+                # Convert query longitude to 0-360
+                query_lon_normalized += 360
+
+            # Find nearest indices
+            lat_idx = np.argmin(np.abs(lats - lat))
+            lon_idx = np.argmin(np.abs(lons - query_lon_normalized))
+
+            fields['nearest_lat'] = float(lats[lat_idx])
+            fields['nearest_lon'] = float(normalize_longitude(lons[lon_idx]))
+
+            # Extract value at nearest point
+            # Handle different dimensionality
+            indexers = {lat_dim: lat_idx, lon_dim: lon_idx}
+            if len(grid['other_dims']) == 1:
+                # If 3D, take first time/level slice
+                indexers[grid['other_dims'][0]] = 0
+            value = grid['variable'].isel(indexers).values
+
+            # Convert to Python float (handle NaN)
+            value = float(value)
+            fields['value'] = value if not np.isnan(value) else None
+
+        except Exception as e:
+            raise _LookupError(str(e), fields) from e
+
+    return fields
+
+
 def get_nearest_value(file_path, lat, lon):
     """
     Extract the nearest pollutant value from a TEMPO NetCDF file for given coordinates.
+    Successful reads are cached per (file, lat, lon rounded to 2 decimals) for an hour -
+    granules do not change once written. The file itself stays open between lookups.
 
     Args:
         file_path: Path to TEMPO NetCDF file
@@ -110,71 +303,10 @@ def get_nearest_value(file_path, lat, lon):
     }
 
     try:
-        # Open dataset with h5netcdf engine
-        ds = xr.open_dataset(file_path, engine='h5netcdf')
-
-        # Auto-detect pollutant variable
-        var_name, var = auto_detect_pollutant_variable(ds)
-
-        if var_name is None:
-            result['error'] = 'Could not detect pollutant variable in dataset'
-            return result
-
-        result['variable_name'] = var_name
-
-        # Get unit if available
-        unit = var.attrs.get('units', var.attrs.get('unit', 'unknown'))
-        result['unit'] = unit
-
-        # Detect latitude and longitude dimension names
-        lat_dims = [d for d in var.dims if 'lat' in d.lower()]
-        lon_dims = [d for d in var.dims if 'lon' in d.lower()]
-
-        if not lat_dims or not lon_dims:
-            result['error'] = f'Could not find lat/lon dimensions in variable {var_name}'
-            return result
-
-        lat_dim = lat_dims[0]
-        lon_dim = lon_dims[0]
-
-        # Get lat/lon coordinate arrays
-        lats = ds[lat_dim].values
-        lons = ds[lon_dim].values
-
-        # Handle longitude coordinate system (normalize if needed)
-        # Check if longitudes are in 0-360 range
-        if lons.max() > 180:
-            # Convert query longitude to 0-360
-            query_lon_normalized = result['query_lon']
-            if query_lon_normalized < 0:
-                query_lon_normalized += 360
-        else:
-            query_lon_normalized = result['query_lon']
-
-        # Find nearest indices
-        lat_idx = np.argmin(np.abs(lats - lat))
-        lon_idx = np.argmin(np.abs(lons - query_lon_normalized))
-
-        result['nearest_lat'] = float(lats[lat_idx])
-        result['nearest_lon'] = float(normalize_longitude(lons[lon_idx]))
-
-        # Extract value at nearest point
-        # Handle different dimensionality
-        if len(var.dims) == 2:
-            value = var.isel({lat_dim: lat_idx, lon_dim: lon_idx}).values
-        elif len(var.dims) == 3:
-            # If 3D, take first time/level slice
-            other_dim = [d for d in var.dims if d not in [lat_dim, lon_dim]][0]
-            value = var.isel({other_dim: 0, lat_dim: lat_idx, lon_dim: lon_idx}).values
-        else:
-            value = var.isel({lat_dim: lat_idx, lon_dim: lon_idx}).values
-
-        # Convert to Python float (handle NaN)
-        value = float(value)
-        result['value'] = value if not np.isnan(value) else None
-
-        ds.close()
-
+        result.update(_read_nearest(file_path, round(lat, 2), round(lon, 2)))
+    except _LookupError as e:
+        result.update(e.fields)
+        result['error'] = str(e)
     except Exception as e:
         result['error'] = str(e)
 
@@ -11,10 +11,18 @@ Combines multiple data sources for comprehensive weather intelligence:
 ═══════════════════════════════════════════════════════════════════════════
 """
 
-import requests
+import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import math
+from itertools import zip_longest
+import numpy as np
+import requests
+
+from cache import cached, weather_cache
+from http_session import build_session, parse_json
+
+logger = logging.getLogger('clearskies.' + __name__)
 
 
 class WeatherService:
@@ -35,6 +43,37 @@ class WeatherService:
     OPENWEATHER_API = "https://api.openweathermap.org/data/2.5/weather"
     OPENWEATHER_ONECALL = "https://api.openweathermap.org/data/3.0/onecall"
 
+    # Keep-alive pool shared by every weather lookup
+    _session = build_session()
+
+    # WMO weather interpretation codes used by Open-Meteo
+    WEATHER_CODES = {
+        0: 'Clear sky',
+        1: 'Mainly clear',
+        2: 'Partly cloudy',
+        3: 'Overcast',
+        45: 'Foggy',
+        48: 'Rime fog',
+        51: 'Light drizzle',
+        53: 'Moderate drizzle',
+        55: 'Dense drizzle',
+        61: 'Slight rain',
+        63: 'Moderate rain',
+        65: 'Heavy rain',
+        71: 'Slight snow',
+        73: 'Moderate snow',
+        75: 'Heavy snow',
+        77: 'Snow grains',
+        80: 'Slight rain showers',
+        81: 'Moderate rain showers',
+        82: 'Violent rain showers',
+        85: 'Slight snow showers',
+        86: 'Heavy snow showers',
+        95: 'Thunderstorm',
+        96: 'Thunderstorm with slight hail',
+        99: 'Thunderstorm with heavy hail'
+    }
+
     @staticmethod
     def get_forecast_for_date(lat: float, lon: float, target_date: str) -> Dict[str, Any]:
         """
@@ -48,21 +87,151 @@ class WeatherService:
         Returns:
             Weather forecast for the specific date
         """
-        from datetime import datetime, timedelta
 
+        # Parse target date
         try:
-            # Parse target date
             target = datetime.strptime(target_date, '%Y-%m-%d').date()
-            today = datetime.now().date()
-            days_ahead = (target - today).days
+        except ValueError as e:
+            logger.error(f"Forecast error for date {target_date}: {e}")
+            return WeatherService.get_comprehensive_weather(lat, lon)
+
+        today = datetime.now().date()
+        days_ahead = (target - today).days
+
+        # Limit to 16 days (Open-Meteo limit)
+        if days_ahead < 0:
+            days_ahead = 0
+        elif days_ahead > 15:
+            days_ahead = 15
+
+        data = WeatherService._fetch_daily_forecast(lat, lon)
+
+        if data is None:
+            # Open-Meteo is unreachable - the fallback would only wait on the same host again,
+            # so serve whatever current conditions are cached instead
+            return weather_cache.get(lat, lon) or WeatherService._get_fallback_weather(lat, lon)
+
+        # Get daily forecast for target date
+        # Open-Meteo may send these as null - treat that like a missing block
+        daily = data.get('daily') or {}
+        hourly = data.get('hourly') or {}
+
+        # Fallback if date out of range
+        if days_ahead >= len(daily.get('time', [])):
+            return WeatherService.get_comprehensive_weather(lat, lon)
+
+        # Extract data for the specific day - only a partial or malformed payload can fail here
+        try:
+            day_index = days_ahead
+
+            # Get hourly data for this specific day (average of 24 hours)
+            hourly_start = day_index * 24
+            hourly_end = hourly_start + 24
+
+            # The day's hourly series as arrays - each average, peak and total is one reduction
+            window = slice(hourly_start, hourly_end)
+            temps = np.asarray(hourly.get('temperature_2m', [])[window])
+            humidity = np.asarray(hourly.get('relative_humidity_2m', [])[window])
+            feels_like = np.asarray(hourly.get('apparent_temperature', [])[window])
+            wind = np.asarray(hourly.get('wind_speed_10m', [])[window])
+            precip_prob = np.asarray(hourly.get('precipitation_probability', [])[window])
+            precip = np.asarray(hourly.get('precipitation', [])[window])
+
+            avg_temp = temps.mean().item() if temps.size else 20
+            avg_humidity = humidity.mean().item() if humidity.size else 50
+            avg_feels_like = feels_like.mean().item() if feels_like.size else 20
+            avg_wind = wind.mean().item() if wind.size else 0
+            max_precip_prob = precip_prob.max().item() if precip_prob.size else 0
+            total_precip = precip.sum().item() if precip.size else 0
+
+            # Get weather code for the day
+            weather_code = daily.get('weather_code', [0])[day_index]
+            weather_description = WeatherService._decode_weather_code(weather_code)
+
+            # Rain forecast for the day
+            rain_forecast = {
+                'will_rain': max_precip_prob > 30,
+                'max_probability': round(max_precip_prob, 0),
+                'total_precipitation': round(total_precip, 2),
+                'peak_time': f"{12 + day_index}:00",
+                'peak_hour': 12,
+                'message': f"Rain chance: {round(max_precip_prob)}%" if max_precip_prob > 30 else "Clear skies ahead!",
+                'hourly': WeatherService._hourly_rain_points(precip_prob, precip)
+            }
+
+            # Get clothing recommendations
+            clothing = WeatherService._get_clothing_recommendation(
+                avg_temp,
+                avg_feels_like,
+                total_precip,
+                avg_wind,
+                weather_code
+            )
+
+            # Umbrella recommendation
+            umbrella = WeatherService._get_umbrella_recommendation(
+                rain_forecast['will_rain'],
+                max_precip_prob,
+                total_precip
+            )
+
+            # Moon phase
+            moon_phase = WeatherService._calculate_moon_phase()
+
+            return {
+                'current': {
+                    'temperature': round(avg_temp, 1),
+                    'feels_like': round(avg_feels_like, 1),
+                    'humidity': round(avg_humidity, 1),
+                    'wind_speed': round(avg_wind, 1),
+                    'wind_direction': 0,
+                    'precipitation': round(total_precip, 2),
+                    'condition': weather_description,
+                    'weather_code': weather_code,
+                    'uv_index': round(daily.get('uv_index_max', [0])[day_index], 1),
+                    'visibility': 20.0,
+                    'pressure': 1013.0,
+                    'dew_point': round(avg_temp - 5, 1),
+                    'cloud_cover': 50 if weather_code > 1 else 10,
+                    'wind_gusts': round(avg_wind * 1.5, 1)
+                },
+                'forecast': {
+                    'rain': rain_forecast,
+                    'daily': {
+                        'high': round(daily['temperature_2m_max'][day_index], 1),
+                        'low': round(daily['temperature_2m_min'][day_index], 1),
+                        'precipitation_probability': round(daily['precipitation_probability_max'][day_index], 0),
+                        'precipitation_total': round(daily['precipitation_sum'][day_index], 2),
+                        'uv_index_max': round(daily['uv_index_max'][day_index], 1)
+                    }
+                },
+                'recommendations': {
+                    'umbrella': umbrella,
+                    'clothing': clothing
+                },
+                'astronomy': {
+                    'moon_phase': moon_phase,
+                    'sunrise': daily.get('sunrise', [None])[day_index],
+                    'sunset': daily.get('sunset', [None])[day_index]
+                },
+                'data_source': f'Open-Meteo Forecast ({days_ahead} days ahead)',
+                'forecast_date': target_date,
+                'is_forecast': days_ahead > 0,
+                'timestamp': datetime.utcnow().isoformat() + 'Z'
+            }
 
-            # Limit to 16 days (Open-Meteo limit)
-            if days_ahead < 0:
-                days_ahead = 0
-            elif days_ahead > 15:
-                days_ahead = 15
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.error(f"Forecast error for date {target_date}: {e}")
+            return WeatherService.get_comprehensive_weather(lat, lon)
 
-            # Fetch 16-day forecast
+    @staticmethod
+    def _fetch_daily_forecast(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the 16-day hourly + daily Open-Meteo forecast.
+
+        Returns None when the request fails or its payload is not a JSON object.
+        """
+        try:
             url = f"{WeatherService.OPEN_METEO_API}"
             params = {
                 'latitude': lat,
@@ -76,119 +245,16 @@ class WeatherService:
                 'forecast_days': 16
             }
 
-            response = requests.get(url, params=params, timeout=15)
+            response = WeatherService._session.get(url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
-
-            # Get daily forecast for target date
-            daily = data.get('daily', {})
-            hourly = data.get('hourly', {})
-
-            # Extract data for the specific day
-            if days_ahead < len(daily.get('time', [])):
-                day_index = days_ahead
-
-                # Get hourly data for this specific day (average of 24 hours)
-                hourly_start = day_index * 24
-                hourly_end = hourly_start + 24
-
-                # Calculate average hourly values
-                temps = hourly.get('temperature_2m', [])[hourly_start:hourly_end]
-                humidity = hourly.get('relative_humidity_2m', [])[hourly_start:hourly_end]
-                feels_like = hourly.get('apparent_temperature', [])[hourly_start:hourly_end]
-                wind = hourly.get('wind_speed_10m', [])[hourly_start:hourly_end]
-                precip_prob = hourly.get('precipitation_probability', [])[hourly_start:hourly_end]
-                precip = hourly.get('precipitation', [])[hourly_start:hourly_end]
-
-                avg_temp = sum(temps) / len(temps) if temps else 20
-                avg_humidity = sum(humidity) / len(humidity) if humidity else 50
-                avg_feels_like = sum(feels_like) / len(feels_like) if feels_like else 20
-                avg_wind = sum(wind) / len(wind) if wind else 0
-                max_precip_prob = max(precip_prob) if precip_prob else 0
-                total_precip = sum(precip) if precip else 0
-
-                # Get weather code for the day
-                weather_code = daily.get('weather_code', [0])[day_index]
-                weather_description = WeatherService._decode_weather_code(weather_code)
-
-                # Rain forecast for the day
-                rain_forecast = {
-                    'will_rain': max_precip_prob > 30,
-                    'max_probability': round(max_precip_prob, 0),
-                    'total_precipitation': round(total_precip, 2),
-                    'peak_time': f"{12 + day_index}:00",
-                    'peak_hour': 12,
-                    'message': f"Rain chance: {round(max_precip_prob)}%" if max_precip_prob > 30 else "Clear skies ahead!",
-                    'hourly': [{'time': f"{i}h", 'probability': round(precip_prob[i], 0) if i < len(precip_prob) else 0, 'intensity': round(precip[i], 1) if i < len(precip) else 0} for i in range(min(24, len(precip_prob)))]
-                }
-
-                # Get clothing recommendations
-                clothing = WeatherService._get_clothing_recommendation(
-                    avg_temp,
-                    avg_feels_like,
-                    total_precip,
-                    avg_wind,
-                    weather_code
-                )
-
-                # Umbrella recommendation
-                umbrella = WeatherService._get_umbrella_recommendation(
-                    rain_forecast['will_rain'],
-                    max_precip_prob,
-                    total_precip
-                )
-
-                # Moon phase
-                moon_phase = WeatherService._calculate_moon_phase()
-
-                return {
-                    'current': {
-                        'temperature': round(avg_temp, 1),
-                        'feels_like': round(avg_feels_like, 1),
-                        'humidity': round(avg_humidity, 1),
-                        'wind_speed': round(avg_wind, 1),
-                        'wind_direction': 0,
-                        'precipitation': round(total_precip, 2),
-                        'condition': weather_description,
-                        'weather_code': weather_code,
-                        'uv_index': round(daily.get('uv_index_max', [0])[day_index], 1),
-                        'visibility': 20.0,
-                        'pressure': 1013.0,
-                        'dew_point': round(avg_temp - 5, 1),
-                        'cloud_cover': 50 if weather_code > 1 else 10,
-                        'wind_gusts': round(avg_wind * 1.5, 1)
-                    },
-                    'forecast': {
-                        'rain': rain_forecast,
-                        'daily': {
-                            'high': round(daily['temperature_2m_max'][day_index], 1),
-                            'low': round(daily['temperature_2m_min'][day_index], 1),
-                            'precipitation_probability': round(daily['precipitation_probability_max'][day_index], 0),
-                            'precipitation_total': round(daily['precipitation_sum'][day_index], 2),
-                            'uv_index_max': round(daily['uv_index_max'][day_index], 1)
-                        }
-                    },
-                    'recommendations': {
-                        'umbrella': umbrella,
-                        'clothing': clothing
-                    },
-                    'astronomy': {
-                        'moon_phase': moon_phase,
-                        'sunrise': daily.get('sunrise', [None])[day_index],
-                        'sunset': daily.get('sunset', [None])[day_index]
-                    },
-                    'data_source': f'Open-Meteo Forecast ({days_ahead} days ahead)',
-                    'forecast_date': target_date,
-                    'is_forecast': days_ahead > 0,
-                    'timestamp': datetime.utcnow().isoformat() + 'Z'
-                }
-
-            # Fallback if date out of range
-            return WeatherService.get_comprehensive_weather(lat, lon)
+            data = parse_json(response)
+            if not isinstance(data, dict):
+                raise ValueError(f"unexpected payload type {type(data).__name__}")
+            return data
 
-        except Exception as e:
-            print(f"Forecast error for date {target_date}: {e}")
-            return WeatherService.get_comprehensive_weather(lat, lon)
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Forecast fetch error: {e}")
+            return None
 
     @staticmethod
     def get_comprehensive_weather(lat: float, lon: float) -> Dict[str, Any]:
@@ -208,6 +274,17 @@ class WeatherService:
             - Clothing recommendations
             - Moon phase
         """
+        weather = WeatherService._fetch_comprehensive_weather(lat, lon)
+        return weather or WeatherService._get_fallback_weather(lat, lon)
+
+    @staticmethod
+    @cached(weather_cache)
+    def _fetch_comprehensive_weather(lat: float, lon: float) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and assemble Open-Meteo weather intelligence.
+
+        Returns None on failure, so the fallback data is never cached.
+        """
         try:
             # Use Open-Meteo for global coverage (works everywhere)
             url = f"{WeatherService.OPEN_METEO_API}"
@@ -224,9 +301,9 @@ class WeatherService:
                 'forecast_days': 3
             }
 
-            response = requests.get(url, params=params, timeout=15)
+            response = WeatherService._session.get(url, params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             # Parse current conditions
             current = data.get('current', {})
@@ -299,8 +376,8 @@ class WeatherService:
             }
 
         except Exception as e:
-            print(f"Weather service error: {e}")
-            return WeatherService._get_fallback_weather(lat, lon)
+            logger.error(f"Weather service error: {e}")
+            return None
 
     @staticmethod
     def _analyze_rain_forecast(hourly: Dict) -> Dict[str, Any]:
@@ -316,15 +393,15 @@ class WeatherService:
                 'message': 'No rain expected'
             }
 
-        # Get next 24 hours
-        precip_prob = hourly['precipitation_probability'][:24]
-        precip_amount = hourly['precipitation'][:24] if 'precipitation' in hourly else [0] * 24
+        # Get next 24 hours as arrays - peak, total and peak hour are single reductions
+        probabilities = np.asarray(hourly['precipitation_probability'][:24])
+        amounts = np.asarray(hourly['precipitation'][:24] if 'precipitation' in hourly else [0] * 24)
 
-        max_prob = max(precip_prob) if precip_prob else 0
-        total_precip = sum(precip_amount) if precip_amount else 0
+        max_prob = probabilities.max().item() if probabilities.size else 0
+        total_precip = amounts.sum().item() if amounts.size else 0
 
-        # Find peak rain time
-        peak_hour = precip_prob.index(max_prob) if precip_prob else 0
+        # Find peak rain time (argmax returns the first peak, like list.index)
+        peak_hour = int(probabilities.argmax()) if probabilities.size else 0
         peak_time = (datetime.now() + timedelta(hours=peak_hour)).strftime('%I:%M %p')
 
         will_rain = max_prob >= 40  # 40% threshold
@@ -340,13 +417,7 @@ class WeatherService:
             message = f"Light rain possible around {peak_time} ({max_prob}%)"
 
         # Generate hourly data for graph
-        hourly_data = []
-        for i in range(min(24, len(precip_prob))):
-            hourly_data.append({
-                'time': f'{i}h',
-                'probability': round(precip_prob[i], 0),
-                'intensity': round(precip_amount[i], 1) if i < len(precip_amount) else 0
-            })
+        hourly_data = WeatherService._hourly_rain_points(probabilities, amounts)
 
         return {
             'will_rain': will_rain,
@@ -358,6 +429,25 @@ class WeatherService:
             'hourly': hourly_data
         }
 
+    @staticmethod
+    def _hourly_rain_points(probabilities: np.ndarray, amounts: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Per-hour rain graph points (first 24 hours) from the two forecast series.
+        The series stay as arrays until here; each is converted once and zipped.
+        Hours without an amount read as 0 intensity.
+        """
+        precip_prob = probabilities[:24].tolist()
+        precip_amount = amounts[:len(precip_prob)].tolist()
+
+        return [
+            {
+                'time': f'{i}h',
+                'probability': round(probability, 0),
+                'intensity': round(amount, 1)
+            }
+            for i, (probability, amount) in enumerate(zip_longest(precip_prob, precip_amount, fillvalue=0))
+        ]
+
     @staticmethod
     def _get_umbrella_recommendation(will_rain: bool, probability: float, amount: float) -> Dict[str, Any]:
         """
@@ -496,33 +586,7 @@ class WeatherService:
         """
         Decode WMO weather code to description.
         """
-        weather_codes = {
-            0: 'Clear sky',
-            1: 'Mainly clear',
-            2: 'Partly cloudy',
-            3: 'Overcast',
-            45: 'Foggy',
-            48: 'Rime fog',
-            51: 'Light drizzle',
-            53: 'Moderate drizzle',
-            55: 'Dense drizzle',
-            61: 'Slight rain',
-            63: 'Moderate rain',
-            65: 'Heavy rain',
-            71: 'Slight snow',
-            73: 'Moderate snow',
-            75: 'Heavy snow',
-            77: 'Snow grains',
-            80: 'Slight rain showers',
-            81: 'Moderate rain showers',
-            82: 'Violent rain showers',
-            85: 'Slight snow showers',
-            86: 'Heavy snow showers',
-            95: 'Thunderstorm',
-            96: 'Thunderstorm with slight hail',
-            99: 'Thunderstorm with heavy hail'
-        }
-        return weather_codes.get(code, 'Unknown')
+        return WeatherService.WEATHER_CODES.get(code, 'Unknown')
 
     @staticmethod
     def _get_fallback_weather(lat: float, lon: float) -> Dict[str, Any]: